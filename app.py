@@ -1,5 +1,7 @@
 import streamlit as st
 import os
+import json
+from itertools import chain
 from dotenv import load_dotenv
 from typing import Dict, Any
 
@@ -12,10 +14,18 @@ from framework.tool_utils import (
     get_tool_description,
     get_tool_env_requirements,
 )
-from generators.prompt_builder import prompt_builder
 
 st.set_page_config(page_title="CrewAI Generator", page_icon="🤖", layout="wide")
 
+# Number of generated code lines shown inline; the full script is downloadable
+CODE_PREVIEW_LINES = 40
+
+
+@st.cache_data(show_spinner=False)
+def cached_crewai_code(config_json: str) -> str:
+    """Generates CrewAI code, cached on the canonical JSON of the configuration"""
+    return create_crewai_code(json.loads(config_json))
+
 
 def main():
     st.title("🤖 CrewAI Generator")
@@ -57,6 +67,10 @@ def main():
         selected_tab = st.sidebar.radio("Navigation", tabs)
 
     if selected_tab == "Prompt Builder":
+        # Imported here so the LLM/OpenRouter stack (requests, urllib3) only
+        # loads once the Prompt Builder is actually opened
+        from generators.prompt_builder import prompt_builder
+
         prompt_builder()
     elif selected_tab == "Agent Builder":
         agent_builder()
@@ -127,6 +141,12 @@ def agent_builder():
                         st.code(f"{req['env_var']}=your_value_here")
 
     # Display existing agents
+    existing_agents_panel()
+
+
+@st.fragment
+def existing_agents_panel():
+    """Lists existing agents; deleting one only reruns this panel"""
     if st.session_state.config["agents"]:
         st.header("Existing Agents")
         for i, agent in enumerate(st.session_state.config["agents"]):
@@ -140,14 +160,15 @@ def agent_builder():
                     st.write("**Tools:** None")
 
                 if st.button(f"Delete Agent", key=f"delete_agent_{i}"):
-                    st.session_state.config["agents"].pop(i)
-                    # Also remove tasks associated with this agent
-                    st.session_state.config["tasks"] = [
+                    config = st.session_state.config
+                    removed_name = config["agents"].pop(i)["name"]
+                    # Also remove tasks associated with this agent, in one pass
+                    config["tasks"][:] = [
                         task
-                        for task in st.session_state.config["tasks"]
-                        if task["agent"] != agent["name"]
+                        for task in config["tasks"]
+                        if task["agent"] != removed_name
                     ]
-                    st.rerun()
+                    st.rerun(scope="fragment")
 
 
 def task_builder():
@@ -185,6 +206,12 @@ def task_builder():
                 st.success(f"Task '{name}' added successfully!")
 
     # Display existing tasks
+    existing_tasks_panel()
+
+
+@st.fragment
+def existing_tasks_panel():
+    """Lists existing tasks; deleting one only reruns this panel"""
     if st.session_state.config["tasks"]:
         st.header("Existing Tasks")
         for i, task in enumerate(st.session_state.config["tasks"]):
@@ -195,7 +222,7 @@ def task_builder():
 
                 if st.button(f"Delete Task", key=f"delete_task_{i}"):
                     st.session_state.config["tasks"].pop(i)
-                    st.rerun()
+                    st.rerun(scope="fragment")
 
 
 def preview_and_code():
@@ -211,10 +238,11 @@ def preview_and_code():
         return
 
     # Check for environment variable requirements
-    all_tools = []
-    for agent in st.session_state.config["agents"]:
-        if "tools" in agent and agent["tools"]:
-            all_tools.extend(agent["tools"])
+    all_tools = list(
+        chain.from_iterable(
+            agent.get("tools") or [] for agent in st.session_state.config["agents"]
+        )
+    )
 
     env_requirements = get_tool_env_requirements(all_tools)
     if env_requirements:
@@ -228,14 +256,27 @@ def preview_and_code():
     render_crewai_overview(st.session_state.config)
 
     # Generate and display code
+    generated_code_panel(st.session_state.config, env_requirements)
+
+
+@st.fragment
+def generated_code_panel(config, env_requirements):
+    """Shows the generated code and downloads; reruns independently of the page"""
     st.header("Generated CrewAI Code")
-    generated_code = create_crewai_code(st.session_state.config)
-    st.code(generated_code, language="python")
+    generated_code = cached_crewai_code(json.dumps(config, sort_keys=True))
+
+    # Only highlight a preview of long scripts unless the full code is requested
+    code_lines = generated_code.splitlines()
+    if len(code_lines) > CODE_PREVIEW_LINES and not st.toggle("Show full code"):
+        preview = "\n".join(code_lines[:CODE_PREVIEW_LINES])
+        st.code(f"{preview}\n# … truncated, use Download", language="python")
+    else:
+        st.code(generated_code, language="python")
 
     # Download button for the generated code
     st.download_button(
         label="Download Python Code",
-        data=generated_code,
+        data=generated_code.encode("utf-8"),
         file_name="crew_ai_script.py",
         mime="text/plain",
     )
@@ -248,7 +289,7 @@ def preview_and_code():
 
         st.download_button(
             label="Download .env Template",
-            data=env_template,
+            data=env_template.encode("utf-8"),
             file_name=".env.template",
             mime="text/plain",
         )
@@ -1,12 +1,31 @@
-from .crewai_generator import create_crewai_code, render_crewai_overview
-from .langgraph_generator import create_langgraph_code, render_langgraph_overview
+import importlib
+
+# Generator exports resolved lazily so importing the package only loads the
+# framework module that is actually used
+_LAZY_EXPORTS = {
+    "create_crewai_code": ".crewai_generator",
+    "render_crewai_overview": ".crewai_generator",
+    "create_langgraph_code": ".langgraph_generator",
+    "render_langgraph_overview": ".langgraph_generator",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def create_code_block(config, framework):
     """Factory function to create code for the selected framework"""
     if framework == "crewai":
+        from .crewai_generator import create_crewai_code
+
         return create_crewai_code(config)
     elif framework == "langgraph":
+        from .langgraph_generator import create_langgraph_code
+
         return create_langgraph_code(config)
     else:
         return "# Invalid framework specified"
@@ -15,6 +34,10 @@ def create_code_block(config, framework):
 def render_framework_overview(config, framework):
     """Factory function to render visual overview for the selected framework"""
     if framework == "crewai":
+        from .crewai_generator import render_crewai_overview
+
         return render_crewai_overview(config)
     elif framework == "langgraph":
+        from .langgraph_generator import render_langgraph_overview
+
         return render_langgraph_overview(config)
@@ -1,4 +1,43 @@
+from itertools import chain
 from typing import Dict, Any
+import streamlit as st
+
+# Tools that need constructor arguments; every other tool is instantiated as Tool()
+TOOL_CONSTRUCTORS = {
+    "DirectoryReadTool": "DirectoryReadTool(directory_path='.')",
+    "FileReadTool": "FileReadTool(file_path='example.txt')",
+}
+
+# Environment variables checked at the top of the generated script
+TOOL_ENV_VARS = {
+    "SerperDevTool": "SERPER_API_KEY",
+    "BrowserTool": "BROWSERLESS_API_KEY",
+    "GmailTool": "GMAIL_TOKEN_PATH",
+}
+
+# Code templates rendered once per agent/task with str.format_map; free-text
+# fields are substituted as Python literals (repr) so quotes cannot break them
+AGENT_TEMPLATE = (
+    "# Agent: {name}\n"
+    "{tools_decl}"
+    "agent_{name} = Agent(\n"
+    "    role={role},\n"
+    "    goal={goal},\n"
+    "    backstory={backstory},\n"
+    "    verbose={verbose},\n"
+    "    allow_delegation={allow_delegation},\n"
+    "    tools={tools_ref}\n"
+    ")\n\n"
+)
+
+TASK_TEMPLATE = (
+    "# Task: {name}\n"
+    "task_{name} = Task(\n"
+    "    description={description},\n"
+    "    agent=agent_{agent},\n"
+    "    expected_output={expected_output}\n"
+    ")\n\n"
+)
 
 
 def create_crewai_code(config: Dict[str, Any]) -> str:
@@ -11,109 +50,91 @@ def create_crewai_code(config: Dict[str, Any]) -> str:
     Returns:
         String containing generated Python code for CrewAI
     """
-    code = "from crewai import Agent, Task, Crew\n"
+    parts = ["from crewai import Agent, Task, Crew\n"]
 
     # Add tool imports if needed
-    used_tools = set()
-    for agent in config["agents"]:
-        if "tools" in agent and agent["tools"]:
-            for tool in agent["tools"]:
-                used_tools.add(tool)
+    used_tools = set(
+        chain.from_iterable(agent.get("tools") or [] for agent in config["agents"])
+    )
 
     if used_tools:
-        code += "from crewai_tools import (\n"
-        code += "    " + ",\n    ".join(sorted(used_tools))
-        code += "\n)\n"
+        parts.append("from crewai_tools import (\n")
+        parts.append("    " + ",\n    ".join(sorted(used_tools)))
+        parts.append("\n)\n")
 
         # Add environment variables if needed
-        env_vars = set()
-        if "SerperDevTool" in used_tools:
-            env_vars.add("SERPER_API_KEY")
-        if "BrowserTool" in used_tools:
-            env_vars.add("BROWSERLESS_API_KEY")
-        if "GmailTool" in used_tools:
-            env_vars.add("GMAIL_TOKEN_PATH")
+        env_vars = {TOOL_ENV_VARS[tool] for tool in used_tools & TOOL_ENV_VARS.keys()}
 
         if env_vars:
-            code += "\nimport os\nfrom dotenv import load_dotenv\n\n"
-            code += "# Load environment variables\n"
-            code += "load_dotenv()\n\n"
+            parts.append("\nimport os\nfrom dotenv import load_dotenv\n\n")
+            parts.append("# Load environment variables\n")
+            parts.append("load_dotenv()\n\n")
 
             # Add check for required env variables
-            for var in env_vars:
-                code += f"if '{var}' not in os.environ:\n"
-                code += f'    raise ValueError("Please set the {var} environment variable")\n'
-            code += "\n"
+            for var in sorted(env_vars):
+                parts.append(f"if '{var}' not in os.environ:\n")
+                parts.append(
+                    f'    raise ValueError("Please set the {var} environment variable")\n'
+                )
+            parts.append("\n")
 
-    code += "\n"
+    parts.append("\n")
 
     # Generate Agent configurations
     for agent in config["agents"]:
-        code += f"# Agent: {agent['name']}\n"
+        tools_decl = ""
+        tools_ref = "[]"
 
         # Create tools list if tools are defined
         if "tools" in agent and agent["tools"]:
-            tool_instances = []
-            for tool in agent["tools"]:
-                if tool == "SerperDevTool":
-                    tool_instances.append(f"{tool}()")
-                elif tool == "BrowserTool":
-                    tool_instances.append(f"{tool}()")
-                elif tool == "DirectoryReadTool":
-                    tool_instances.append(f"{tool}(directory_path='.')")
-                elif tool == "FileReadTool":
-                    tool_instances.append(f"{tool}(file_path='example.txt')")
-                elif tool == "WebsiteSearchTool":
-                    tool_instances.append(f"{tool}()")
-                elif tool == "WikipediaSearchTool":
-                    tool_instances.append(f"{tool}()")
-                else:
-                    tool_instances.append(f"{tool}()")
-
+            tool_instances = [
+                TOOL_CONSTRUCTORS.get(tool, f"{tool}()") for tool in agent["tools"]
+            ]
             tools_str = ", ".join(tool_instances)
-            code += f"tools_{agent['name']} = [{tools_str}]\n"
-
-        # Create agent
-        code += f"agent_{agent['name']} = Agent(\n"
-        code += f"    role='{agent['role']}',\n"
-        code += f"    goal='{agent['goal']}',\n"
-        code += f"    backstory='{agent['backstory']}',\n"
-        code += f"    verbose={agent['verbose']},\n"
-        code += f"    allow_delegation={agent['allow_delegation']},\n"
-
-        # Add tools reference if available
-        if "tools" in agent and agent["tools"]:
-            code += f"    tools=tools_{agent['name']}\n"
-        else:
-            code += "    tools=[]\n"
-
-        code += ")\n\n"
+            tools_decl = f"tools_{agent['name']} = [{tools_str}]\n"
+            tools_ref = f"tools_{agent['name']}"
+
+        parts.append(
+            AGENT_TEMPLATE.format_map(
+                {
+                    **agent,
+                    "role": repr(agent["role"]),
+                    "goal": repr(agent["goal"]),
+                    "backstory": repr(agent["backstory"]),
+                    "tools_decl": tools_decl,
+                    "tools_ref": tools_ref,
+                }
+            )
+        )
 
     # Generate Task configurations
     for task in config["tasks"]:
-        code += f"# Task: {task['name']}\n"
-        code += f"task_{task['name']} = Task(\n"
-        code += f"    description='{task['description']}',\n"
-        code += f"    agent=agent_{task['agent']},\n"
-        code += f"    expected_output='{task['expected_output']}'\n"
-        code += ")\n\n"
+        parts.append(
+            TASK_TEMPLATE.format_map(
+                {
+                    **task,
+                    "description": repr(task["description"]),
+                    "expected_output": repr(task["expected_output"]),
+                }
+            )
+        )
 
     # Generate Crew configuration
-    code += "# Crew Configuration\n"
-    code += "crew = Crew(\n"
-    code += (
+    parts.append("# Crew Configuration\n")
+    parts.append("crew = Crew(\n")
+    parts.append(
         "    agents=["
         + ", ".join(f"agent_{a['name']}" for a in config["agents"])
         + "],\n"
     )
-    code += (
+    parts.append(
         "    tasks=[" + ", ".join(f"task_{t['name']}" for t in config["tasks"]) + "]\n"
     )
-    code += ")\n\n"
-    code += "# Run the crew\n"
-    code += "result = crew.kickoff()"
+    parts.append(")\n\n")
+    parts.append("# Run the crew\n")
+    parts.append("result = crew.kickoff()")
 
-    return code
+    return "".join(parts)
 
 
 def render_crewai_overview(config: Dict[str, Any]):
@@ -123,24 +144,53 @@ def render_crewai_overview(config: Dict[str, Any]):
     Args:
         config: Dictionary containing agents and tasks configuration
     """
-    import streamlit as st
+    show_details = st.toggle("Show details", value=False)
 
     # Display Agents
     st.subheader("Agents")
-    for agent in config["agents"]:
-        with st.expander(f"🤖 {agent['role']}", expanded=True):
-            st.write(f"**Goal:** {agent['goal']}")
-            st.write(f"**Backstory:** {agent['backstory']}")
-
-            if "tools" in agent and agent["tools"]:
-                st.write(f"**Tools:** {', '.join(agent['tools'])}")
-            else:
-                st.write("**Tools:** None")
+    st.dataframe(
+        [
+            {
+                "Name": agent["name"],
+                "Role": agent["role"],
+                "Goal": agent["goal"],
+                "Tools": ", ".join(agent.get("tools") or []) or "None",
+            }
+            for agent in config["agents"]
+        ],
+        hide_index=True,
+        use_container_width=True,
+    )
+    if show_details:
+        for agent in config["agents"]:
+            with st.expander(f"🤖 {agent['role']}", expanded=True):
+                tools = ", ".join(agent.get("tools") or []) or "None"
+                st.markdown(
+                    f"**Goal:** {agent['goal']}\n\n"
+                    f"**Backstory:** {agent['backstory']}\n\n"
+                    f"**Tools:** {tools}"
+                )
 
     # Display Tasks
     st.subheader("Tasks")
-    for task in config["tasks"]:
-        with st.expander(f"📋 {task['name']}", expanded=True):
-            st.write(f"**Description:** {task['description']}")
-            st.write(f"**Expected Output:** {task['expected_output']}")
-            st.write(f"**Assigned to:** {task['agent']}")
+    st.dataframe(
+        [
+            {
+                "Name": task["name"],
+                "Description": task["description"],
+                "Expected Output": task["expected_output"],
+                "Assigned to": task["agent"],
+            }
+            for task in config["tasks"]
+        ],
+        hide_index=True,
+        use_container_width=True,
+    )
+    if show_details:
+        for task in config["tasks"]:
+            with st.expander(f"📋 {task['name']}", expanded=True):
+                st.markdown(
+                    f"**Description:** {task['description']}\n\n"
+                    f"**Expected Output:** {task['expected_output']}\n\n"
+                    f"**Assigned to:** {task['agent']}"
+                )
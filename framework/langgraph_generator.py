@@ -1,17 +1,11 @@
+import json
+from functools import lru_cache
+from itertools import chain
 from typing import Dict, Any
+import streamlit as st
 
-
-def create_langgraph_code(config: Dict[str, Any]) -> str:
-    """
-    Generates LangGraph Python code from the provided configuration.
-
-    Args:
-        config: Dictionary containing agents, nodes and edges configuration
-
-    Returns:
-        String containing generated Python code for LangGraph
-    """
-    code = """from langgraph.graph import StateGraph, END
+# Static script header: imports and graph state definition
+LANGGRAPH_HEADER = """from langgraph.graph import StateGraph, END
 from langchain_core.messages import HumanMessage, AIMessage
 from langchain_openai import ChatOpenAI
 from langchain_core.tools import BaseTool
@@ -25,80 +19,63 @@ class AgentState(TypedDict):
 
 """
 
-    # Generate tool definitions if needed
-    if any(agent["tools"] for agent in config["agents"]):
-        code += "# Define tools\n"
-        tools = set()
-        for agent in config["agents"]:
-            tools.update(agent["tools"])
-
-        for tool in tools:
-            code += f"""class {tool.capitalize()}Tool(BaseTool):
-    name = "{tool}"
-    description = "Tool for {tool} operations"
-    
-    def _run(self, query: str) -> str:
-        # Implement actual functionality here
-        return f"Result from {tool} tool: {{query}}"
-    
-    async def _arun(self, query: str) -> str:
-        # Implement actual functionality here
-        return f"Result from {tool} tool: {{query}}"
-
-"""
-
-        code += "tools = [\n"
-        for tool in tools:
-            code += f"    {tool.capitalize()}Tool(),\n"
-        code += "]\n\n"
-
-    # Generate Agent configurations
-    for agent in config["agents"]:
-        code += f"# Agent: {agent['name']}\n"
-        code += f"def {agent['name']}_agent(state: AgentState) -> AgentState:\n"
-        code += f"    \"\"\"Agent that handles {agent['role']}.\"\"\"\n"
-        code += f"    # Create LLM\n"
-        code += f"    llm = ChatOpenAI(model=\"{agent['llm']}\")\n"
-        code += f"    # Get the most recent message\n"
-        code += f"    messages = state['messages']\n"
-        code += f"    response = llm.invoke(messages)\n"
-        code += f"    # Add the response to the messages\n"
-        code += f"    return {{\n"
-        code += f'        "messages": messages + [response],\n'
-        code += f'        "next": state.get("next", "")\n'
-        code += f"    }}\n\n"
-
-    # Define routing logic function
-    code += """# Define routing logic
+# Per-entity templates rendered with str.format_map
+TOOL_CLASS_TEMPLATE = (
+    "class {class_name}Tool(BaseTool):\n"
+    '    name = "{tool}"\n'
+    '    description = "Tool for {tool} operations"\n'
+    "    \n"
+    "    def _run(self, query: str) -> str:\n"
+    "        # Implement actual functionality here\n"
+    '        return f"Result from {tool} tool: {{query}}"\n'
+    "    \n"
+    "    async def _arun(self, query: str) -> str:\n"
+    "        # Implement actual functionality here\n"
+    '        return f"Result from {tool} tool: {{query}}"\n'
+    "\n"
+)
+
+AGENT_FUNCTION_TEMPLATE = (
+    "# Agent: {name}\n"
+    "def {name}_agent(state: AgentState) -> AgentState:\n"
+    '    """Agent that handles {role}."""\n'
+    "    # Create LLM\n"
+    '    llm = ChatOpenAI(model="{llm}")\n'
+    "    # Get the most recent message\n"
+    "    messages = state['messages']\n"
+    "    response = llm.invoke(messages)\n"
+    "    # Add the response to the messages\n"
+    "    return {{\n"
+    '        "messages": messages + [response],\n'
+    '        "next": state["next"]\n'
+    "    }}\n\n"
+)
+
+# Shared fragments of the add_node/add_edge lines, joined around the names
+ADD_NODE_PREFIX = 'workflow.add_node("'
+ADD_NODE_SEPARATOR = '", '
+ADD_NODE_SUFFIX = "_agent)\n"
+ADD_EDGE_PREFIX = 'workflow.add_edge("'
+ADD_EDGE_SEPARATOR = '", "'
+ADD_EDGE_SUFFIX = '")\n'
+ADD_EDGE_TO_END_SUFFIX = '", END)\n'
+
+# Static routing function and graph setup emitted between agents and edges
+ROUTER_CODE = """# Define routing logic
 def router(state: AgentState) -> str:
     \"\"\"Route to the next node.\"\"\"
-    return state.get("next", "END")
+    return state["next"]
 
 """
-
-    # Generate graph configuration
-    code += "# Define the graph\n"
-    code += "workflow = StateGraph(AgentState)\n\n"
-
-    # Add nodes
-    code += "# Add nodes to the graph\n"
-    for node in config["nodes"]:
-        code += f"workflow.add_node(\"{node['name']}\", {node['agent']}_agent)\n"
-
-    code += "\n# Add conditional edges\n"
-    # Add edges
-    for edge in config["edges"]:
-        if edge["target"] == "END":
-            code += f"workflow.add_edge(\"{edge['source']}\", END)\n"
-        else:
-            code += f"workflow.add_edge(\"{edge['source']}\", \"{edge['target']}\")\n"
-
-    # Set entry point
-    if config["nodes"]:
-        code += f"\n# Set entry point\nworkflow.set_entry_point(\"{config['nodes'][0]['name']}\")\n"
-
-    # Compile and run
-    code += """
+GRAPH_SETUP_CODE = (
+    "# Define the graph\n"
+    "workflow = StateGraph(AgentState)\n\n"
+    "# Add nodes to the graph\n"
+)
+EDGES_HEADER = "\n# Add conditional edges\n"
+
+# Static script footer: compile the graph and run it
+LANGGRAPH_FOOTER = """
 # Compile the graph
 app = workflow.compile()
 
@@ -118,7 +95,117 @@ if __name__ == "__main__":
         print(f"{message.type}: {message.content}")
 """
 
-    return code
+# Complete script for a configuration without agents, nodes or edges
+EMPTY_LANGGRAPH_CODE = (
+    LANGGRAPH_HEADER + ROUTER_CODE + GRAPH_SETUP_CODE + EDGES_HEADER + LANGGRAPH_FOOTER
+)
+
+
+def create_langgraph_code(config: Dict[str, Any]) -> str:
+    """
+    Generates LangGraph Python code from the provided configuration.
+
+    Args:
+        config: Dictionary containing agents, nodes and edges configuration
+
+    Returns:
+        String containing generated Python code for LangGraph
+    """
+    # Nothing configured yet: skip serialization and generation entirely
+    if not config.get("agents") and not config.get("nodes") and not config.get("edges"):
+        return EMPTY_LANGGRAPH_CODE
+
+    return cached_langgraph_code(json.dumps(config, sort_keys=True, default=str))
+
+
+@lru_cache(maxsize=32)
+def cached_langgraph_code(config_json: str) -> str:
+    """
+    Generates LangGraph code, memoized on the canonical JSON of the configuration.
+
+    Args:
+        config_json: JSON-serialized configuration with sorted keys
+
+    Returns:
+        String containing generated Python code for LangGraph
+    """
+    config = json.loads(config_json)
+    agents = config["agents"]
+    nodes = config["nodes"]
+    edges = config["edges"]
+    parts = [LANGGRAPH_HEADER]
+
+    # Each section below is joined into a single fragment, so parts stays a
+    # dozen entries long regardless of the configuration size
+
+    # Generate tool definitions if needed
+    tools = sorted(set().union(*(agent["tools"] for agent in agents)))
+    if tools:
+        class_names = [tool.capitalize() for tool in tools]
+        parts.append("# Define tools\n")
+        parts.append(
+            "".join(
+                TOOL_CLASS_TEMPLATE.format_map({"tool": tool, "class_name": class_name})
+                for tool, class_name in zip(tools, class_names)
+            )
+        )
+        parts.append(
+            "tools = [\n"
+            + "".join(f"    {class_name}Tool(),\n" for class_name in class_names)
+            + "]\n\n"
+        )
+
+    # Generate Agent configurations
+    parts.append("".join(AGENT_FUNCTION_TEMPLATE.format_map(agent) for agent in agents))
+
+    # Define routing logic function
+    parts.append(ROUTER_CODE)
+
+    # Generate graph configuration and add nodes
+    parts.append(GRAPH_SETUP_CODE)
+    parts.append(
+        "".join(
+            chain.from_iterable(
+                (
+                    ADD_NODE_PREFIX,
+                    node["name"],
+                    ADD_NODE_SEPARATOR,
+                    node["agent"],
+                    ADD_NODE_SUFFIX,
+                )
+                for node in nodes
+            )
+        )
+    )
+
+    # Add edges
+    parts.append(EDGES_HEADER)
+    edge_fragments = (
+        (
+            (ADD_EDGE_PREFIX, edge["source"], ADD_EDGE_TO_END_SUFFIX)
+            if edge["target"] == "END"
+            else (
+                ADD_EDGE_PREFIX,
+                edge["source"],
+                ADD_EDGE_SEPARATOR,
+                edge["target"],
+                ADD_EDGE_SUFFIX,
+            )
+        )
+        for edge in edges
+    )
+    parts.append("".join(chain.from_iterable(edge_fragments)))
+
+    # Set entry point
+    if nodes:
+        parts.append(
+            f"\n# Set entry point\nworkflow.set_entry_point(\"{nodes[0]['name']}\")\n"
+        )
+
+    # Compile and run
+    parts.append(LANGGRAPH_FOOTER)
+
+    return "".join(parts)
 
 
 def render_langgraph_overview(config: Dict[str, Any]):
@@ -128,8 +215,6 @@ def render_langgraph_overview(config: Dict[str, Any]):
     Args:
         config: Dictionary containing agents, nodes and edges configuration
     """
-    import streamlit as st
-
     # Display Agents
     st.subheader("Agents")
     for agent in config["agents"]:
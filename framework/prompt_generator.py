@@ -1,13 +1,129 @@
 import re
-from typing import Dict, Any, List, Tuple
+import string
+import copy
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
 import streamlit as st
 from framework.tool_utils import get_available_tools
 
+# Patterns run case-sensitively on a case-folded copy of the prompt and values
+# are sliced from the original by position. Besides A-Z, these are the only
+# characters IGNORECASE equates with ASCII letters; every mapping is 1:1, so
+# positions in the folded copy line up with the original text.
+CASE_FOLD = str.maketrans(
+    {
+        **{upper: upper.lower() for upper in string.ascii_uppercase},
+        "\u0130": "i",  # İ
+        "\u0131": "i",  # ı
+        "\u017f": "s",  # ſ
+        "\u212a": "k",  # Kelvin sign
+    }
+)
+
+# Block patterns: split the prompt into agent and task sections
+AGENT_BLOCK_RE = re.compile(
+    r"agent[:\s]+([^#]+?)(?=\bagent[:\s]+|\btask[:\s]+|$)", re.DOTALL
+)
+TASK_BLOCK_RE = re.compile(
+    r"task[:\s]+([^#]+?)(?=\bagent[:\s]+|\btask[:\s]+|$)", re.DOTALL
+)
+
+# Field patterns: one scan per agent/task block. The lookahead tries every
+# position, so fields on the same line are all found, like separate searches.
+AGENT_FIELDS_RE = re.compile(
+    r"(?=(?P<field>name|role|goal|backstory|tools?)[:\s]+(?P<value>[^\n]+))"
+)
+TASK_FIELDS_RE = re.compile(
+    r"(?=(?P<field>name|description|(?:expected_)?output|agent)[:\s]+(?P<value>[^\n]+))"
+)
+FIELD_ALIASES = {"tools": "tool", "expected_output": "output"}
+TOOL_SEPARATORS = str.maketrans({";": ","})
+
+# Completeness indicators used by analyze_prompt_completeness, found in one scan
+INDICATORS_RE = re.compile(
+    r"\b(?P<indicator>agents?|tasks?|tools?|role|goal|description)[\s:]+"
+)
+ALL_INDICATORS = frozenset({"agent", "task", "tool", "role", "goal", "description"})
+
+
+def find_blocks(pattern: re.Pattern, text: str, folded: str) -> List[Tuple[str, str]]:
+    """Returns (original, case-folded) pairs for each block the pattern captures"""
+    return [
+        (text[match.start(1) : match.end(1)], match.group(1))
+        for match in pattern.finditer(folded)
+    ]
+
+
+def extract_block_fields(
+    pattern: re.Pattern, block: str, folded: str
+) -> Dict[str, str]:
+    """Returns the first stripped value of each field found in a prompt block"""
+    fields = {}
+    for match in pattern.finditer(folded):
+        field = match.group("field")
+        value = block[match.start("value") : match.end("value")]
+        fields.setdefault(FIELD_ALIASES.get(field, field), value.strip())
+    return fields
+
+
+@lru_cache(maxsize=1)
+def get_tool_name_index() -> Tuple[Dict[str, str], List[Tuple[str, int, str]]]:
+    """
+    Builds the lowercase lookup structures for the tool catalog once per process
+
+    Returns:
+        Tuple of a lowercase name -> tool name dict and the sorted
+        (lowercase name, catalog position, tool name) tuples for prefix search
+    """
+    tools_by_lower_name = {tool.lower(): tool for tool in get_available_tools()}
+    sorted_tools = sorted(
+        (lower_name, position, tool)
+        for position, (lower_name, tool) in enumerate(tools_by_lower_name.items())
+    )
+    return tools_by_lower_name, sorted_tools
+
+
+def find_tool_by_prefix(
+    prefix: str, sorted_tools: List[Tuple[str, int, str]]
+) -> Optional[str]:
+    """
+    Finds the tool whose lowercase name starts with the given prefix
+
+    Args:
+        prefix: Lowercase tool name fragment typed by the user
+        sorted_tools: Sorted (lowercase name, catalog position, tool name) tuples
+
+    Returns:
+        The matching tool listed first in the catalog, or None if nothing matches
+    """
+    start = bisect_left(sorted_tools, (prefix,))
+    end = bisect_left(sorted_tools, (prefix + "\U0010ffff",), start)
+    if start == end:
+        return None
+    return min(sorted_tools[start:end], key=lambda entry: entry[1])[2]
+
 
 def generate_config_from_prompt(prompt: str) -> Tuple[Dict[str, Any], List[str]]:
     """
     Generates CrewAI configuration from a natural language prompt
 
+    Args:
+        prompt: User's natural language prompt describing the desired agents and tasks
+
+    Returns:
+        Tuple containing the generated config dictionary and any warnings
+    """
+    # Callers may edit the config, so hand out copies of the memoized result
+    config, warnings = parse_prompt_config(prompt)
+    return copy.deepcopy(config), list(warnings)
+
+
+@lru_cache(maxsize=32)
+def parse_prompt_config(prompt: str) -> Tuple[Dict[str, Any], List[str]]:
+    """
+    Parses a prompt into a CrewAI configuration, memoized on the prompt text
+
     Args:
         prompt: User's natural language prompt describing the desired agents and tasks
 
@@ -18,63 +134,50 @@ def generate_config_from_prompt(prompt: str) -> Tuple[Dict[str, Any], List[str]]
     warnings = []
 
     # Get available tools for validation
-    available_tools = get_available_tools()
+    tools_by_lower_name, sorted_tools = get_tool_name_index()
+
+    # Block patterns need an "agent"/"task" anchor; a substring test on the
+    # folded prompt rules them out in C before running the regex engine
+    prompt_folded = prompt.translate(CASE_FOLD)
 
     # Try to extract agent information
-    agent_blocks = re.findall(
-        r"Agent[:\s]+([^#]+?)(?=\bAgent[:\s]+|\bTask[:\s]+|$)",
-        prompt,
-        re.IGNORECASE | re.DOTALL,
+    agent_blocks = (
+        find_blocks(AGENT_BLOCK_RE, prompt, prompt_folded)
+        if "agent" in prompt_folded
+        else []
     )
 
     if not agent_blocks:
         warnings.append("No agents could be identified in your prompt.")
 
     # Process each agent block
-    for i, agent_block in enumerate(agent_blocks):
+    for i, (agent_block, agent_block_folded) in enumerate(agent_blocks):
         # Extract agent details
-        name_match = re.search(r"name[:\s]+([^\n]+)", agent_block, re.IGNORECASE)
-        role_match = re.search(r"role[:\s]+([^\n]+)", agent_block, re.IGNORECASE)
-        goal_match = re.search(r"goal[:\s]+([^\n]+)", agent_block, re.IGNORECASE)
-        backstory_match = re.search(
-            r"backstory[:\s]+([^\n]+)", agent_block, re.IGNORECASE
-        )
-        tools_match = re.search(r"tool(?:s)?[:\s]+([^\n]+)", agent_block, re.IGNORECASE)
+        fields = extract_block_fields(AGENT_FIELDS_RE, agent_block, agent_block_folded)
 
         # Set default values
         name = f"agent_{i+1}"
-        if name_match:
-            name = name_match.group(1).strip().replace(" ", "_")
+        if "name" in fields:
+            name = fields["name"].replace(" ", "_")
 
-        role = "Default Role"
-        if role_match:
-            role = role_match.group(1).strip()
-
-        goal = "Default Goal"
-        if goal_match:
-            goal = goal_match.group(1).strip()
-
-        backstory = ""
-        if backstory_match:
-            backstory = backstory_match.group(1).strip()
+        role = fields.get("role", "Default Role")
+        goal = fields.get("goal", "Default Goal")
+        backstory = fields.get("backstory", "")
 
         # Process tools
         tools = []
-        if tools_match:
-            tool_text = tools_match.group(1).strip()
-            potential_tools = [t.strip() for t in re.split(r"[,;]", tool_text)]
+        if "tool" in fields:
+            tool_text = fields["tool"]
+            tool_tokens = tool_text.translate(TOOL_SEPARATORS).split(",")
+            potential_tools = [t.strip() for t in tool_tokens if t.strip()]
 
             # Validate tools
             for tool in potential_tools:
                 # Try to match tool names (case insensitive and allow partial matches)
-                tool_match = None
-                for available_tool in available_tools.keys():
-                    if (
-                        available_tool.lower() == tool.lower()
-                        or available_tool.lower().startswith(tool.lower())
-                    ):
-                        tool_match = available_tool
-                        break
+                tool_lower = tool.lower()
+                tool_match = tools_by_lower_name.get(tool_lower)
+                if tool_match is None:
+                    tool_match = find_tool_by_prefix(tool_lower, sorted_tools)
 
                 if tool_match:
                     tools.append(tool_match)
@@ -96,11 +199,17 @@ def generate_config_from_prompt(prompt: str) -> Tuple[Dict[str, Any], List[str]]
 
         config["agents"].append(agent)
 
+    # Index agents by lowercase name and role; the first agent claiming a key wins
+    agents_by_lower_key = {}
+    for agent in config["agents"]:
+        agents_by_lower_key.setdefault(agent["name"].lower(), agent["name"])
+        agents_by_lower_key.setdefault(agent["role"].lower(), agent["name"])
+
     # Try to extract task information
-    task_blocks = re.findall(
-        r"Task[:\s]+([^#]+?)(?=\bAgent[:\s]+|\bTask[:\s]+|$)",
-        prompt,
-        re.IGNORECASE | re.DOTALL,
+    task_blocks = (
+        find_blocks(TASK_BLOCK_RE, prompt, prompt_folded)
+        if "task" in prompt_folded
+        else []
     )
 
     if not task_blocks and config["agents"]:
@@ -109,46 +218,25 @@ def generate_config_from_prompt(prompt: str) -> Tuple[Dict[str, Any], List[str]]
         )
 
     # Process each task block
-    for i, task_block in enumerate(task_blocks):
+    for i, (task_block, task_block_folded) in enumerate(task_blocks):
         # Extract task details
-        name_match = re.search(r"name[:\s]+([^\n]+)", task_block, re.IGNORECASE)
-        description_match = re.search(
-            r"description[:\s]+([^\n]+)", task_block, re.IGNORECASE
-        )
-        output_match = re.search(
-            r"(expected_)?output[:\s]+([^\n]+)", task_block, re.IGNORECASE
-        )
-        agent_match = re.search(r"agent[:\s]+([^\n]+)", task_block, re.IGNORECASE)
+        fields = extract_block_fields(TASK_FIELDS_RE, task_block, task_block_folded)
 
         # Set default values
         name = f"task_{i+1}"
-        if name_match:
-            name = name_match.group(1).strip().replace(" ", "_")
-
-        description = "Default task description"
-        if description_match:
-            description = description_match.group(1).strip()
-
-        expected_output = "Task completion report"
-        if output_match:
-            expected_output = (
-                output_match.group(2).strip()
-                if output_match.group(2)
-                else output_match.group(1).strip()
-            )
+        if "name" in fields:
+            name = fields["name"].replace(" ", "_")
+
+        description = fields.get("description", "Default task description")
+        expected_output = fields.get("output", "Task completion report")
 
         # Assign to agent (default to first agent if not specified)
         assigned_agent = config["agents"][0]["name"] if config["agents"] else None
-        if agent_match:
-            agent_name = agent_match.group(1).strip()
+        if "agent" in fields:
             # Try to find matching agent
-            for agent in config["agents"]:
-                if (
-                    agent["name"].lower() == agent_name.lower()
-                    or agent["role"].lower() == agent_name.lower()
-                ):
-                    assigned_agent = agent["name"]
-                    break
+            assigned_agent = agents_by_lower_key.get(
+                fields["agent"].lower(), assigned_agent
+            )
 
         if not assigned_agent:
             warnings.append(
@@ -186,63 +274,58 @@ def analyze_prompt_completeness(prompt: str) -> Dict[str, Any]:
         "missing_fields": [],
     }
 
-    # Check for agent indicators
-    results["has_agents"] = bool(re.search(r"\bagent[s]?[\s:]+", prompt, re.IGNORECASE))
-
-    # Check for task indicators
-    results["has_tasks"] = bool(re.search(r"\btask[s]?[\s:]+", prompt, re.IGNORECASE))
-
-    # Check for tool indicators
-    results["has_tools"] = bool(re.search(r"\btool[s]?[\s:]+", prompt, re.IGNORECASE))
+    # Collect every indicator in a single pass, stopping once all are seen
+    found = set()
+    for match in INDICATORS_RE.finditer(prompt.translate(CASE_FOLD)):
+        found.add(match.group("indicator").rstrip("s"))
+        if found == ALL_INDICATORS:
+            break
 
-    # Check for agent roles
-    if not re.search(r"\brole[\s:]+", prompt, re.IGNORECASE) and results["has_agents"]:
-        results["missing_fields"].append("Agent roles")
+    results["has_agents"] = "agent" in found
+    results["has_tasks"] = "task" in found
+    results["has_tools"] = "tool" in found
 
-    # Check for agent goals
-    if not re.search(r"\bgoal[\s:]+", prompt, re.IGNORECASE) and results["has_agents"]:
-        results["missing_fields"].append("Agent goals")
+    # Check for agent roles and goals
+    if results["has_agents"]:
+        if "role" not in found:
+            results["missing_fields"].append("Agent roles")
+        if "goal" not in found:
+            results["missing_fields"].append("Agent goals")
 
     # Check for task descriptions
-    if (
-        not re.search(r"\bdescription[\s:]+", prompt, re.IGNORECASE)
-        and results["has_tasks"]
-    ):
+    if results["has_tasks"] and "description" not in found:
         results["missing_fields"].append("Task descriptions")
 
     return results
 
 
-def get_prompt_suggestions() -> List[str]:
-    """Returns a list of example prompts"""
-    return [
-        """
+# Example prompts shown to the user, built once at import
+PROMPT_SUGGESTIONS = (
+    """
 Create a research crew with:
 Agent: name: researcher role: Research Specialist goal: Find comprehensive information on AI safety backstory: Expert in data analysis tools: SerperDevTool, WikipediaSearchTool
 Agent: name: writer role: Content Writer goal: Create engaging articles backstory: Former journalist with 10 years experience tools: WebsiteSearchTool
 Task: name: gather_data description: Find the latest research on AI safety agent: researcher
 Task: name: write_article description: Write a 1000-word article on AI safety expected_output: Complete article with citations agent: writer
         """,
-        """
+    """
 I need a web development team:
 Agent: name: frontend role: Frontend Developer goal: Build responsive UI backstory: 5 years of React experience tools: FileReadTool
 Agent: name: backend role: Backend Developer goal: Create robust API backstory: Expert in Python and databases tools: PythonReplTool
 Task: name: design_ui description: Create wireframes for the application agent: frontend
 Task: name: implement_api description: Develop RESTful API endpoints agent: backend
         """,
-        """
+    """
 Create a market research crew:
 Agent: role: Market Analyst goal: Analyze competitor products tools: SerperDevTool, WebsiteSearchTool
 Agent: role: Customer Research Specialist goal: Gather customer feedback tools: FileReadTool
 Task: description: Research top 5 competitors in the market agent: Market Analyst 
 Task: description: Compile a report of customer preferences agent: Customer Research Specialist
         """,
-    ]
-
+)
 
-def get_prompt_template() -> str:
-    """Returns a template for creating agents and tasks"""
-    return """# Define your agents and tasks below
+# Blank template for writing agents and tasks by hand
+PROMPT_TEMPLATE = """# Define your agents and tasks below
 
 Agent:
 name: agent_name
@@ -259,3 +342,13 @@ agent: agent_name
 
 # You can add more agents and tasks following the same format
 """
+
+
+def get_prompt_suggestions() -> Tuple[str, ...]:
+    """Returns a tuple of example prompts"""
+    return PROMPT_SUGGESTIONS
+
+
+def get_prompt_template() -> str:
+    """Returns a template for creating agents and tasks"""
+    return PROMPT_TEMPLATE
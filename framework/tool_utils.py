@@ -1,5 +1,17 @@
+from functools import lru_cache, singledispatch
+from itertools import chain
+from types import MappingProxyType
+
+
 class ToolExecutionContext:
-    """Context for tool execution."""
+    """
+    Context for tool execution.
+
+    Hot paths can read and write ``state`` directly instead of going through
+    get_state/set_state.
+    """
+
+    __slots__ = ("state",)
 
     def __init__(self):
         self.state = {}
@@ -13,19 +25,46 @@ class ToolExecutionContext:
 
 def parse_tool_response(response):
     """Parse a tool response string."""
-    if not response:
-        return None
-    return response
+    return response or None
 
 
+@singledispatch
 def format_tool_input(input_data):
     """Format data as input for a tool."""
-    if isinstance(input_data, dict):
-        return input_data
-    elif isinstance(input_data, str):
-        return {"input": input_data}
-    else:
-        return {"data": input_data}
+    return {"data": input_data}
+
+
+@format_tool_input.register
+def _(input_data: dict):
+    return input_data
+
+
+@format_tool_input.register
+def _(input_data: str):
+    return {"input": input_data}
+
+
+def freeze_mapping(value, shared=None):
+    """
+    Recursively wrap dicts in read-only MappingProxyType views
+
+    Lists become tuples. Value-equal dicts of plain values are frozen once and
+    shared, so repeated entries such as identical parameter specs point at a
+    single object.
+    """
+    if shared is None:
+        shared = {}
+    if isinstance(value, list):
+        return tuple(freeze_mapping(item, shared) for item in value)
+    if not isinstance(value, dict):
+        return value
+    frozen = {k: freeze_mapping(v, shared) for k, v in value.items()}
+    # Keying on the value types keeps 1, 1.0 and True from being merged
+    key = tuple((k, type(v), v) for k, v in frozen.items())
+    try:
+        return shared.setdefault(key, MappingProxyType(frozen))
+    except TypeError:  # holds nested mappings, which are not hashable
+        return MappingProxyType(frozen)
 
 
 def get_tool_by_name(name, tool_registry=None):
@@ -35,11 +74,15 @@ def get_tool_by_name(name, tool_registry=None):
     return tool_registry.get(name)
 
 
+@lru_cache(maxsize=1)
 def get_available_tools():
     """
     Get a dictionary of available CrewAI tools with their configurations
+
+    The registry is built once and shared between callers, so it is returned
+    as nested read-only mappings.
     """
-    return {
+    tools = {
         "SerperDevTool": {
             "description": "Serper.dev API for web search",
             "parameters": {
@@ -792,6 +835,35 @@ def get_available_tools():
         },
     }
 
+    return freeze_mapping(tools)
+
+
+@lru_cache(maxsize=1)
+def get_tool_descriptions():
+    """
+    Get a flat mapping of tool names to their descriptions
+    """
+    return MappingProxyType(
+        {name: tool["description"] for name, tool in get_available_tools().items()}
+    )
+
+
+@lru_cache(maxsize=1)
+def get_required_parameters():
+    """
+    Get the names of each tool's required parameters, in declaration order
+    """
+    return MappingProxyType(
+        {
+            name: tuple(
+                param_name
+                for param_name, param_config in tool["parameters"].items()
+                if param_config.get("required", False)
+            )
+            for name, tool in get_available_tools().items()
+        }
+    )
+
 
 def get_tool_description(tool_name):
     """
@@ -803,60 +875,101 @@ def get_tool_description(tool_name):
     Returns:
         String description of the tool or None if tool doesn't exist
     """
-    tools = get_available_tools()
-    if tool_name in tools:
-        return tools[tool_name]["description"]
-    return None
+    return get_tool_descriptions().get(tool_name)
+
+
+# Numeric parameter types: the converter a value must accept, and how errors
+# name the type
+NUMERIC_PARAMETER_TYPES = {
+    "int": (int, "an integer"),
+    "float": (float, "a float"),
+}
 
 
 def validate_tool_parameters(tool_name, parameters):
     """
     Validate the parameters for a specific tool
 
+    Results are memoized per tool and parameter values, since the configurator
+    re-validates the same inputs on every rerun.
+
     Args:
         tool_name: Name of the tool
         parameters: Dictionary of parameter values
 
     Returns:
-        List of error messages, empty if validation passed
+        Tuple of error messages, empty if validation passed. The tuple may be
+        shared with other callers.
     """
-    errors = []
-    tools = get_available_tools()
+    if tool_name not in get_available_tools():
+        return ("Invalid tool name",)
+
+    # Value types are part of the key: 1, 1.0 and True validate differently
+    param_items = tuple(
+        (name, type(value), value) for name, value in parameters.items()
+    )
+    try:
+        return cached_tool_parameter_errors(tool_name, param_items)
+    except TypeError:  # unhashable values such as lists are validated directly
+        return tuple(check_tool_parameters(tool_name, parameters))
+
+
+@lru_cache(maxsize=512)
+def cached_tool_parameter_errors(tool_name, param_items):
+    """Memoized check_tool_parameters() keyed on (name, type, value) triples"""
+    parameters = {name: value for name, _, value in param_items}
+    return tuple(check_tool_parameters(tool_name, parameters))
+
+
+def check_tool_parameters(tool_name, parameters):
+    """
+    Validate the parameters for a specific tool without caching
+
+    Args:
+        tool_name: Name of the tool
+        parameters: Dictionary of parameter values
 
-    if tool_name not in tools:
+    Returns:
+        List of error messages, empty if validation passed
+    """
+    tool_config = get_available_tools().get(tool_name)
+    if tool_config is None:
         return ["Invalid tool name"]
 
-    tool_config = tools[tool_name]
     expected_params = tool_config["parameters"]
 
     # Check for required parameters
-    for param_name, param_config in expected_params.items():
-        if param_config.get("required", False):
-            if param_name not in parameters or not parameters[param_name]:
-                errors.append(f"Missing required parameter: {param_name}")
+    errors = [
+        f"Missing required parameter: {param_name}"
+        for param_name in get_required_parameters()[tool_name]
+        if not parameters.get(param_name)
+    ]
 
     # Type validation
     for param_name, value in parameters.items():
-        if param_name in expected_params:
-            param_type = expected_params[param_name]["type"]
-
-            # Skip empty optional parameters
-            if not value and not expected_params[param_name].get("required", False):
-                continue
-
-            # Type validation
-            if param_type == "int" and not isinstance(value, int):
-                try:
-                    int(value)
-                except (ValueError, TypeError):
-                    errors.append(f"Parameter {param_name} must be an integer")
-            elif param_type == "float" and not isinstance(value, float):
-                try:
-                    float(value)
-                except (ValueError, TypeError):
-                    errors.append(f"Parameter {param_name} must be a float")
-            elif param_type == "bool" and not isinstance(value, bool):
+        param_config = expected_params.get(param_name)
+        if param_config is None:
+            continue
+
+        # Skip empty optional parameters
+        if not value and not param_config.get("required", False):
+            continue
+
+        param_type = param_config["type"]
+        if param_type == "bool":
+            if not isinstance(value, bool):
                 errors.append(f"Parameter {param_name} must be a boolean")
+            continue
+
+        if param_type not in NUMERIC_PARAMETER_TYPES:
+            continue
+
+        cast, label = NUMERIC_PARAMETER_TYPES[param_type]
+        if not isinstance(value, cast):
+            try:
+                cast(value)
+            except (ValueError, TypeError):
+                errors.append(f"Parameter {param_name} must be {label}")
 
     return errors
 
@@ -872,36 +985,20 @@ def format_tool_for_config(tool_name, parameters):
     Returns:
         Dictionary with tool configuration
     """
-    tools = get_available_tools()
-    tool_config = tools.get(tool_name, {})
-
-    # Clean parameters
-    clean_params = {}
-    for name, value in parameters.items():
-        # Skip empty parameters
-        if value == "" or value is None:
-            continue
-        clean_params[name] = value
-
-    # Format based on tool class name
-    formatted_config = {"type": tool_name, **clean_params}
+    # Format based on tool class name, skipping empty parameters
+    formatted_config = {"type": tool_name}
+    formatted_config.update(
+        (name, value)
+        for name, value in parameters.items()
+        if value is not None and value != ""
+    )
 
     return formatted_config
 
 
-def get_tool_env_requirements(tool_name=None):
-    """
-    Get environment requirements for tools
-
-    Args:
-        tool_name: Optional name of specific tool to get requirements for,
-                  or a list of tool names
-
-    Returns:
-        List of dictionaries with 'env_var' and 'description' keys
-    """
-    # Define environment requirements for each tool
-    env_requirements = {
+# Environment requirements for each tool
+TOOL_ENV_REQUIREMENTS = freeze_mapping(
+    {
         "SerperDevTool": [
             {
                 "env_var": "SERPER_API_KEY",
@@ -1015,21 +1112,35 @@ def get_tool_env_requirements(tool_name=None):
         "WebsiteSearchTool": [],
         "XMLSearchTool": [],
     }
+)
+
+# Flattened requirements of every tool, in TOOL_ENV_REQUIREMENTS order
+ALL_TOOL_ENV_REQUIREMENTS = tuple(chain.from_iterable(TOOL_ENV_REQUIREMENTS.values()))
 
+
+def get_tool_env_requirements(tool_name=None):
+    """
+    Get environment requirements for tools
+
+    Args:
+        tool_name: Optional name of specific tool to get requirements for,
+                  or a list of tool names
+
+    Returns:
+        List of dictionaries with 'env_var' and 'description' keys. For a list
+        of tools, each environment variable appears once.
+    """
     # Handle different input types
     if tool_name is None:
         # Return all requirements as a flat list
-        all_requirements = []
-        for tool_reqs in env_requirements.values():
-            all_requirements.extend(tool_reqs)
-        return all_requirements
+        return list(ALL_TOOL_ENV_REQUIREMENTS)
     elif isinstance(tool_name, list):
-        # Return requirements for a list of tools
-        combined_requirements = []
+        # Return requirements for a list of tools, once per environment variable
+        requirements = {}
         for tool in tool_name:
-            if tool in env_requirements:
-                combined_requirements.extend(env_requirements[tool])
-        return combined_requirements
+            for requirement in TOOL_ENV_REQUIREMENTS.get(tool, ()):
+                requirements.setdefault(requirement["env_var"], requirement)
+        return list(requirements.values())
     else:
         # Return requirements for a single tool
-        return env_requirements.get(tool_name, [])
+        return list(TOOL_ENV_REQUIREMENTS.get(tool_name, ()))
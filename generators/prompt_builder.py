@@ -1,12 +1,16 @@
 import streamlit as st
 import os
-from utils.openrouter import get_openrouter_models
+from utils.openrouter import get_openrouter_model_ids, get_openrouter_model_index
 from utils.llm_generator import (
     generate_crew_with_llm,
     get_available_llm_providers,
     get_example_scenario_prompts,
 )
 
+# OpenAI için sunulan modeller ve seçim kutusundaki konumları
+OPENAI_MODELS = ("gpt-3.5-turbo", "gpt-4", "gpt-4-turbo")
+OPENAI_MODEL_INDEX = {model: i for i, model in enumerate(OPENAI_MODELS)}
+
 
 def prompt_builder():
     """Prompt tabanlı ekip oluşturucu UI"""
@@ -52,26 +56,30 @@ def update_configuration(new_config):
     preview_config(new_config)
 
 
+def merge_by_name(target_items, source_items):
+    """Aynı isimli öğeleri değiştirir, yenilerini sona ekler"""
+    # Aynı isim birden fazla varsa ilk konum kullanılır (list.index gibi)
+    index_by_name = {}
+    for i, item in enumerate(target_items):
+        index_by_name.setdefault(item["name"], i)
+
+    for item in source_items:
+        idx = index_by_name.get(item["name"])
+        if idx is None:
+            index_by_name[item["name"]] = len(target_items)
+            target_items.append(item)
+        else:
+            target_items[idx] = item
+
+
 def merge_configurations(target_config, source_config):
     """İki yapılandırmayı birleştirir"""
 
     # Ajanları birleştir
-    for agent in source_config["agents"]:
-        existing_names = [a["name"] for a in target_config["agents"]]
-        if agent["name"] in existing_names:
-            idx = existing_names.index(agent["name"])
-            target_config["agents"][idx] = agent
-        else:
-            target_config["agents"].append(agent)
+    merge_by_name(target_config["agents"], source_config["agents"])
 
     # Görevleri birleştir
-    for task in source_config["tasks"]:
-        existing_names = [t["name"] for t in target_config["tasks"]]
-        if task["name"] in existing_names:
-            idx = existing_names.index(task["name"])
-            target_config["tasks"][idx] = task
-        else:
-            target_config["tasks"].append(task)
+    merge_by_name(target_config["tasks"], source_config["tasks"])
 
 
 def preview_config(config):
@@ -84,20 +92,21 @@ def preview_config(config):
     with agent_tab:
         for agent in config["agents"]:
             with st.expander(f"🤖 {agent['role']}", expanded=True):
-                st.write(f"**Name:** {agent['name']}")
-                st.write(f"**Goal:** {agent['goal']}")
-                st.write(f"**Backstory:** {agent['backstory']}")
-                if agent["tools"]:
-                    st.write(f"**Tools:** {', '.join(agent['tools'])}")
-                else:
-                    st.write("**Tools:** None")
+                st.markdown(
+                    f"**Name:** {agent['name']}\n\n"
+                    f"**Goal:** {agent['goal']}\n\n"
+                    f"**Backstory:** {agent['backstory']}\n\n"
+                    f"**Tools:** {', '.join(agent['tools']) or 'None'}"
+                )
 
     with task_tab:
         for task in config["tasks"]:
             with st.expander(f"📋 {task['name']}", expanded=True):
-                st.write(f"**Description:** {task['description']}")
-                st.write(f"**Expected Output:** {task['expected_output']}")
-                st.write(f"**Assigned to:** {task['agent']}")
+                st.markdown(
+                    f"**Description:** {task['description']}\n\n"
+                    f"**Expected Output:** {task['expected_output']}\n\n"
+                    f"**Assigned to:** {task['agent']}"
+                )
 
     # Önizleme sayfasına geçiş butonu
     if st.button("Önizleme ve Kod Sayfasına Git"):
@@ -105,6 +114,24 @@ def preview_config(config):
         st.rerun()
 
 
+def select_model(provider, model_options, model_index, env_var):
+    """Model seçim kutusunu gösterir ve seçilen modeli döndürür"""
+    # Öncelik: 1) ENV'de belirtilen model, 2) daha önce seçilmiş model, 3) ilk model
+    env_model = os.environ.get(env_var)
+    default_model_idx = 0
+
+    if env_model and env_model in model_index:
+        default_model_idx = model_index[env_model]
+    elif provider in st.session_state.selected_model:
+        default_model_idx = model_index.get(
+            st.session_state.selected_model[provider], 0
+        )
+
+    model = st.selectbox("Model", options=model_options, index=default_model_idx)
+    st.session_state.selected_model[provider] = model
+    return model
+
+
 def llm_based_crew_builder():
     """LLM tabanlı ekip oluşturucu"""
 
@@ -146,57 +173,23 @@ def llm_based_crew_builder():
             st.session_state.selected_provider = provider
 
         with col2:
-            # Model seçimi için önbellek kullanımı
-            if "model_cache" not in st.session_state:
-                st.session_state.model_cache = {}
-
             if "selected_model" not in st.session_state:
                 st.session_state.selected_model = {}
 
             if provider == "openai":
-                model_options = ["gpt-3.5-turbo", "gpt-4", "gpt-4-turbo"]
-
-                # ENV'de belirtilen model var mı kontrol et
-                env_model = os.environ.get("OPENAI_MODEL")
-                default_model_idx = 0
-
-                if env_model and env_model in model_options:
-                    default_model_idx = model_options.index(env_model)
-                elif provider in st.session_state.selected_model:
-                    # Daha önce seçilmiş model varsa onu kullan
-                    if st.session_state.selected_model[provider] in model_options:
-                        default_model_idx = model_options.index(
-                            st.session_state.selected_model[provider]
-                        )
-
-                model = st.selectbox(
-                    "Model", options=model_options, index=default_model_idx
+                model = select_model(
+                    provider, OPENAI_MODELS, OPENAI_MODEL_INDEX, "OPENAI_MODEL"
                 )
-                st.session_state.selected_model[provider] = model
 
             elif provider == "openrouter":
                 # OpenRouter modellerini direkt cache fonksiyonundan al
                 with st.spinner("Model listesi alınıyor..."):
-                    models = get_openrouter_models()
-                    model_options = [model["model_id"] for model in models]
-
-                # ENV'de belirtilen model var mı kontrol et
-                env_model = os.environ.get("OPENROUTER_MODEL")
-                default_model_idx = 0
-
-                if env_model and env_model in model_options:
-                    default_model_idx = model_options.index(env_model)
-                elif provider in st.session_state.selected_model:
-                    # Daha önce seçilmiş model varsa onu kullan
-                    if st.session_state.selected_model[provider] in model_options:
-                        default_model_idx = model_options.index(
-                            st.session_state.selected_model[provider]
-                        )
-
-                model = st.selectbox(
-                    "Model", options=model_options, index=default_model_idx
+                    model_options = get_openrouter_model_ids()
+                    model_index = get_openrouter_model_index()
+
+                model = select_model(
+                    provider, model_options, model_index, "OPENROUTER_MODEL"
                 )
-                st.session_state.selected_model[provider] = model
 
             else:
                 # Diğer sağlayıcılar için önceki seçimi hatırla
@@ -207,14 +200,12 @@ def llm_based_crew_builder():
                 model = st.text_input("Model İsmi", value=default_model)
                 st.session_state.selected_model[provider] = model
 
-        # API key durumunu kontrol et
+        # API key durumunu kontrol et (yukarıda okunan değerler kullanılır)
         if provider == "openai":
-            api_key = os.environ.get("OPENAI_API_KEY")
-            if not api_key:
+            if not openai_key:
                 st.warning("⚠️ OPENAI_API_KEY bulunamadı. .env dosyasına eklemelisiniz.")
         elif provider == "openrouter":
-            api_key = os.environ.get("OPENROUTER_API_KEY")
-            if not api_key:
+            if not openrouter_key:
                 st.warning(
                     "⚠️ OPENROUTER_API_KEY bulunamadı. .env dosyasına eklemelisiniz."
                 )
@@ -243,11 +234,16 @@ def llm_based_crew_builder():
     if st.button("🔮 Ekip Oluştur", type="primary", disabled=not scenario_prompt):
         st.session_state.scenario_prompt = scenario_prompt
 
-        # Yapay zeka ile yapılandırma oluştur
+        # Yapay zeka ile yapılandırma oluştur, yanıtı geldikçe göster
+        stream_placeholder = st.empty()
         with st.spinner("Yapay zeka ekip yapılandırması oluşturuyor..."):
             config, warnings = generate_crew_with_llm(
-                user_prompt=scenario_prompt, provider=provider, model=model
+                user_prompt=scenario_prompt,
+                provider=provider,
+                model=model,
+                on_chunk=lambda text: stream_placeholder.code(text, language="json"),
             )
+        stream_placeholder.empty()
 
         # Uyarıları göster
         if warnings:
@@ -1,5 +1,33 @@
+import time
 import requests
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+
+MODELS_API_URL = "https://openrouter.ai/api/frontend/models"
+MODELS_CACHE_TTL = 600
+
+# (time.monotonic() of the fetch, raw model data), shared by both filters
+models_cache: Optional[Tuple[float, List[Dict]]] = None
+
+
+def fetch_models_data() -> List[Dict]:
+    """
+    Returns the raw OpenRouter model data, fetching it at most once per TTL.
+
+    Returns:
+        List[Dict]: Model data as returned by the OpenRouter API.
+    """
+    global models_cache
+
+    now = time.monotonic()
+    if models_cache is not None and now - models_cache[0] < MODELS_CACHE_TTL:
+        return models_cache[1]
+
+    response = requests.get(MODELS_API_URL, verify=False)
+    response.raise_for_status()  # Raise an exception for bad status codes
+
+    data = response.json().get("data", [])
+    models_cache = (now, data)
+    return data
 
 
 def get_openrouter_models(free_only: bool = False) -> List[Dict]:
@@ -12,25 +40,19 @@ def get_openrouter_models(free_only: bool = False) -> List[Dict]:
     Returns:
         List[Dict]: List of models with name, slug, author, and provider information.
     """
-    api_url = "https://openrouter.ai/api/frontend/models"
-
     try:
-        response = requests.get(api_url, verify=False)
-        response.raise_for_status()  # Raise an exception for bad status codes
-
-        data = response.json().get("data", [])
+        data = fetch_models_data()
         models_list = []
 
         for model in data:
             # Check if model has required fields
             if all(key in model for key in ["name", "slug", "author"]):
+                # Check for ":free" suffix in the slug
+                is_free = isinstance(model["slug"], str) and ":free" in model["slug"]
+
                 # Check if we need to filter for free models
-                if free_only:
-                    # Check for ":free" suffix in the slug
-                    if not (
-                        isinstance(model["slug"], str) and ":free" in model["slug"]
-                    ):
-                        continue
+                if free_only and not is_free:
+                    continue
 
                 # Extract provider name from endpoint if available
                 provider_name = None
@@ -40,7 +62,7 @@ def get_openrouter_models(free_only: bool = False) -> List[Dict]:
                     and "provider_name" in model["endpoint"]
                 ):
                     provider_name = model["endpoint"]["provider_name"]
-                is_free = isinstance(model["slug"], str) and ":free" in model["slug"]
+
                 # Extract relevant information
                 model_info = {
                     "name": model["name"],
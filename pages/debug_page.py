@@ -1,14 +1,31 @@
 import streamlit as st
 import time
-import json
 import os
+from utils.openrouter import (
+    clear_models_cache,
+    get_models_cache_time,
+    get_openrouter_model_ids,
+    get_openrouter_model_search_keys,
+)
+
+# Model listesinde bir sayfada gösterilen model sayısı
+MODELS_PAGE_SIZE = 25
+TIME_FORMAT = "%d.%m.%Y %H:%M:%S"
+
+# Debug sayfasında gösterilen çevresel değişkenler ve değerin maskelenip maskelenmeyeceği
+DEBUG_ENV_VARS = (
+    ("OPENAI_API_KEY", True),
+    ("OPENROUTER_API_KEY", True),
+    ("OPENAI_MODEL", False),
+    ("OPENROUTER_MODEL", False),
+)
 
 
 def format_time(timestamp):
     """Timestamp'i okunabilir formata dönüştürür"""
     if not timestamp:
         return "Hiç güncellenmemiş"
-    return time.strftime("%d.%m.%Y %H:%M:%S", time.localtime(timestamp))
+    return time.strftime(TIME_FORMAT, time.localtime(timestamp))
 
 
 def format_cache_age(timestamp):
@@ -25,6 +42,39 @@ def format_cache_age(timestamp):
         return f"{age_seconds/3600:.1f} saat önce"
 
 
+@st.fragment
+def openrouter_model_list(model_options):
+    """Model arama kutusu ve listesi; arama yalnızca bu bölümü yeniden çalıştırır"""
+    # Filtreleme alanı
+    filter_text = st.text_input("Model Ara:", "")
+
+    # Modelleri filtrele ve göster
+    models = model_options
+    if filter_text:
+        # Model isimleri önceden küçük harfe çevrilip önbelleğe alınır
+        needle = filter_text.lower()
+        search_keys = get_openrouter_model_search_keys()
+        models = [
+            model
+            for model, search_key in zip(model_options, search_keys)
+            if needle in search_key
+        ]
+
+    if models:
+        st.write(f"{len(models)} model bulundu")
+
+        # Yalnızca seçili sayfadaki modeller çizilir
+        page_count = -(-len(models) // MODELS_PAGE_SIZE)
+        page = 1
+        if page_count > 1:
+            page = st.number_input("Sayfa", min_value=1, max_value=page_count, value=1)
+        start = (page - 1) * MODELS_PAGE_SIZE
+        for model in models[start : start + MODELS_PAGE_SIZE]:
+            st.code(model)
+    else:
+        st.info("Filtreye uygun model bulunamadı")
+
+
 def debug_view():
     st.set_page_config(page_title="Debug View", page_icon="🐞")
 
@@ -38,15 +88,22 @@ def debug_view():
     with tabs[0]:
         st.subheader("Session State İçeriği")
 
-        # Session state anahtarlarını kategorize et
-        config_keys = [k for k in st.session_state.keys() if k == "config"]
-        model_keys = [k for k in st.session_state.keys() if "model" in k]
-        nav_keys = [k for k in st.session_state.keys() if "navigation" in k]
-        other_keys = [
-            k
-            for k in st.session_state.keys()
-            if k not in config_keys + model_keys + nav_keys and k != "model_cache"
-        ]
+        # Session state anahtarlarını tek geçişte kategorize et
+        config_keys, model_keys, nav_keys, other_keys = [], [], [], []
+        for k in st.session_state.keys():
+            if k == "config":
+                config_keys.append(k)
+                continue
+
+            # Hem "model" hem "navigation" içeren anahtar iki grupta da gösterilir
+            is_model = "model" in k
+            is_nav = "navigation" in k
+            if is_model:
+                model_keys.append(k)
+            if is_nav:
+                nav_keys.append(k)
+            if not (is_model or is_nav):
+                other_keys.append(k)
 
         # Yapılandırma bilgisi
         if config_keys:
@@ -77,9 +134,11 @@ def debug_view():
         # Diğer session state verileri
         if other_keys:
             st.write("### Diğer Session State Verileri")
-            for key in other_keys:
-                st.write(f"**{key}:**")
-                st.write(st.session_state[key])
+            # Değerler yalnızca istenirse serileştirilir
+            if st.checkbox(f"{len(other_keys)} Anahtarı Göster", value=False):
+                for key in other_keys:
+                    st.write(f"**{key}:**")
+                    st.write(st.session_state[key])
 
         # Session state temizleme işlemleri
         st.write("---")
@@ -88,8 +147,7 @@ def debug_view():
         col1, col2 = st.columns(2)
         with col1:
             if st.button("🗑️ Tüm Session State'i Temizle", type="primary"):
-                for key in list(st.session_state.keys()):
-                    del st.session_state[key]
+                st.session_state.clear()
                 st.success("Tüm session state temizlendi!")
                 st.rerun()
 
@@ -103,9 +161,11 @@ def debug_view():
     with tabs[1]:
         st.subheader("Model Cache Bilgisi")
 
-        if "model_cache" in st.session_state:
-            cache = st.session_state.model_cache
-            timestamp = cache.get("timestamp", 0)
+        # Bellekte model listesi varsa st.cache_data üzerinden gelir; sayfa
+        # açılışında OpenRouter'a istek atılmaz
+        model_options = get_openrouter_model_ids() if get_models_cache_time() else []
+        if model_options:
+            timestamp = get_models_cache_time()
 
             col1, col2, col3 = st.columns(3)
             with col1:
@@ -113,73 +173,56 @@ def debug_view():
             with col2:
                 st.metric("Cache Yaşı", format_cache_age(timestamp))
             with col3:
-                if "openrouter" in cache:
-                    st.metric("OpenRouter Model Sayısı", len(cache["openrouter"]))
+                st.metric("OpenRouter Model Sayısı", len(model_options))
 
             # OpenRouter modelleri
-            if "openrouter" in cache and cache["openrouter"]:
-                st.write("### OpenRouter Modelleri")
-
-                # Filtreleme alanı
-                filter_text = st.text_input("Model Ara:", "")
-
-                # Modelleri filtrele ve göster
-                models = cache["openrouter"]
-                if filter_text:
-                    models = [m for m in models if filter_text.lower() in m.lower()]
-
-                if models:
-                    st.write(f"{len(models)} model bulundu")
-                    for i, model in enumerate(models):
-                        st.code(model)
-                else:
-                    st.info("Filtreye uygun model bulunamadı")
+            st.write("### OpenRouter Modelleri")
+            openrouter_model_list(model_options)
 
             # Cache temizleme
             if st.button("🧹 Model Cache'i Temizle"):
-                if "model_cache" in st.session_state:
-                    del st.session_state["model_cache"]
-                    st.success("Model cache temizlendi!")
-                    st.rerun()
+                clear_models_cache()
+                st.success("Model cache temizlendi!")
+                st.rerun()
         else:
             st.info("Henüz model cache oluşturulmamış.")
 
             # Proaktif önbellek oluşturma
             if st.button("OpenRouter Modellerini Önbelleğe Al"):
-                from utils.openrouter import get_openrouter_models
-
                 with st.spinner("OpenRouter modelleri alınıyor..."):
-                    try:
-                        st.session_state.model_cache = {}
-                        models = get_openrouter_models()
-                        model_options = [model["model_id"] for model in models]
-                        st.session_state.model_cache["openrouter"] = model_options
-                        st.session_state.model_cache["timestamp"] = time.time()
-                        st.success(
-                            f"{len(model_options)} model başarıyla önbelleğe alındı!"
-                        )
-                        st.rerun()
-                    except Exception as e:
-                        st.error(f"Model listesi alınamadı: {str(e)}")
+                    model_options = get_openrouter_model_ids()
+
+                if model_options:
+                    st.success(
+                        f"{len(model_options)} model başarıyla önbelleğe alındı!"
+                    )
+                    st.rerun()
+                else:
+                    # Boş sonuç önbellekte kalmasın, tekrar denenebilsin
+                    clear_models_cache()
+                    st.error("Model listesi alınamadı")
 
     with tabs[2]:
         st.subheader("Sistem Bilgisi")
 
         # Çevresel değişkenler (hassas bilgileri maskeleyerek)
         st.write("### Çevresel Değişkenler")
-        env_vars = {
-            "OPENAI_API_KEY": (
-                "***" if os.environ.get("OPENAI_API_KEY") else "Tanımlanmamış"
-            ),
-            "OPENROUTER_API_KEY": (
-                "***" if os.environ.get("OPENROUTER_API_KEY") else "Tanımlanmamış"
-            ),
-            "OPENAI_MODEL": os.environ.get("OPENAI_MODEL", "Tanımlanmamış"),
-            "OPENROUTER_MODEL": os.environ.get("OPENROUTER_MODEL", "Tanımlanmamış"),
-        }
+        env_vars = {}
+        for env_var, masked in DEBUG_ENV_VARS:
+            value = os.environ.get(env_var)
+            if value is None or (masked and not value):
+                env_vars[env_var] = "Tanımlanmamış"
+            else:
+                env_vars[env_var] = "***" if masked else value
 
         st.json(env_vars)
 
+        # Widget anahtarı sayfa değişince silindiği için değer ayrıca saklanır
+        st.session_state.debug_mode = st.checkbox(
+            "LLM hatalarında tam traceback'i konsola yaz",
+            value=st.session_state.get("debug_mode", False),
+        )
+
         # Streamlit Bilgileri
         st.write("### Streamlit Bilgileri")
         is_sidebar = st.sidebar.checkbox("Bu kutucuk görünürse sidebar aktif demektir")
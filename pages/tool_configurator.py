@@ -6,6 +6,37 @@ from framework.tool_utils import (
 )
 
 
+def text_parameter_input(label, default, help_text):
+    return st.text_input(label, value=default, help=help_text)
+
+
+def int_parameter_input(label, default, help_text):
+    return st.number_input(
+        label, value=int(default) if default else 0, step=1, help=help_text
+    )
+
+
+def float_parameter_input(label, default, help_text):
+    return st.number_input(
+        label, value=float(default) if default else 0.0, help=help_text
+    )
+
+
+def bool_parameter_input(label, default, help_text):
+    return st.checkbox(
+        label, value=default if isinstance(default, bool) else False, help=help_text
+    )
+
+
+# Input widget for each tool parameter type
+PARAMETER_WIDGETS = {
+    "str": text_parameter_input,
+    "int": int_parameter_input,
+    "float": float_parameter_input,
+    "bool": bool_parameter_input,
+}
+
+
 def tool_configurator():
     """
     Streamlit UI for configuring CrewAI tools
@@ -33,55 +64,46 @@ def tool_configurator():
     # Configure tool parameters
     st.subheader(f"Configure {selected_tool}")
 
-    # Initialize parameters
-    params = {}
-    for param_name, param_config in tool_info["parameters"].items():
-        param_type = param_config["type"]
-        param_desc = param_config.get("description", "")
-        param_required = param_config.get("required", False)
-        param_default = param_config.get("default", "")
-
-        label = f"{param_name} {'(required)' if param_required else ''}"
-
-        # Add appropriate input field based on parameter type
-        if param_type == "str":
-            params[param_name] = st.text_input(
-                label, value=param_default, help=param_desc
-            )
-        elif param_type == "int":
-            params[param_name] = st.number_input(
-                label,
-                value=int(param_default) if param_default else 0,
-                step=1,
-                help=param_desc,
-            )
-        elif param_type == "float":
-            params[param_name] = st.number_input(
-                label,
-                value=float(param_default) if param_default else 0.0,
-                help=param_desc,
-            )
-        elif param_type == "bool":
-            params[param_name] = st.checkbox(
-                label,
-                value=param_default if isinstance(param_default, bool) else False,
-                help=param_desc,
-            )
-
-    # Display tool configuration code
-    st.subheader("Generated Tool Configuration")
-
-    # Validate parameters
-    errors = validate_tool_parameters(selected_tool, params)
-    if errors:
-        for error in errors:
-            st.error(error)
-    else:
-        tool_config = format_tool_for_config(selected_tool, params)
+    # Initialize parameters; inputs are batched in a form so typing does not
+    # rerun the page until the configuration is submitted
+    with st.form("tool_params"):
+        params = {}
+        for param_name, param_config in tool_info["parameters"].items():
+            param_type = param_config["type"]
+            param_desc = param_config.get("description", "")
+            param_required = param_config.get("required", False)
+            param_default = param_config.get("default", "")
+
+            label = f"{param_name} {'(required)' if param_required else ''}"
+
+            # Add appropriate input field based on parameter type
+            widget = PARAMETER_WIDGETS.get(param_type)
+            if widget:
+                params[param_name] = widget(label, param_default, param_desc)
+
+        submitted = st.form_submit_button("Generate Configuration")
+
+    if submitted:
+        errors = validate_tool_parameters(selected_tool, params)
+        st.session_state.tool_params_result = (
+            selected_tool,
+            errors,
+            None if errors else format_tool_for_config(selected_tool, params),
+        )
 
-        # Display how to use this tool in your config
-        st.code(
-            f"""
+    # Display tool configuration code for the last submitted parameters
+    result = st.session_state.get("tool_params_result")
+    if result and result[0] == selected_tool:
+        st.subheader("Generated Tool Configuration")
+
+        _, errors, tool_config = result
+        if errors:
+            for error in errors:
+                st.error(error)
+        else:
+            # Display how to use this tool in your config
+            st.code(
+                f"""
 # Tool configuration for {selected_tool}
 tool_config = {tool_config}
 
@@ -96,21 +118,23 @@ agent_config = {{
     "tools": [tool_config]
 }}
         """
-        )
+            )
 
-        # Add button to copy configuration
-        if st.button("Add to Session"):
-            if "configured_tools" not in st.session_state:
-                st.session_state.configured_tools = []
+            # Add button to copy configuration
+            if st.button("Add to Session"):
+                if "configured_tools" not in st.session_state:
+                    st.session_state.configured_tools = []
 
-            st.session_state.configured_tools.append(tool_config)
-            st.success(f"Added {selected_tool} to your tools!")
+                st.session_state.configured_tools.append(dict(tool_config))
+                st.success(f"Added {selected_tool} to your tools!")
 
     # Display currently configured tools
     if "configured_tools" in st.session_state and st.session_state.configured_tools:
         st.subheader("Your Configured Tools")
+        last_index = len(st.session_state.configured_tools) - 1
         for i, tool in enumerate(st.session_state.configured_tools):
-            with st.expander(f"Tool {i+1}: {tool['type']}", expanded=True):
+            # Only the most recently added tool starts expanded
+            with st.expander(f"Tool {i+1}: {tool['type']}", expanded=i == last_index):
                 st.write(tool)
                 if st.button(f"Remove Tool {i+1}", key=f"remove_{i}"):
                     st.session_state.configured_tools.pop(i)
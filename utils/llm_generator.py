@@ -1,10 +1,11 @@
 import os
 import json
-import requests
-import urllib3
-from typing import Dict, Any, Tuple, List, Optional
+import traceback
+from functools import lru_cache
+from typing import Dict, Any, Tuple, List, Optional, Callable
 import streamlit as st
-from framework.tool_utils import get_available_tools
+from framework.tool_utils import get_available_tools, get_tool_descriptions
+from utils.openrouter import OPENROUTER_SESSION
 
 # LLM Servis sağlayıcıları
 LLM_PROVIDERS = {
@@ -12,18 +13,51 @@ LLM_PROVIDERS = {
     "openrouter": "OpenRouter API",
 }
 
+# LLM yanıtındaki JSON nesnesini tek geçişte ayrıştırmak için
+JSON_DECODER = json.JSONDecoder()
+
+
+def format_error_details(error: Exception) -> str:
+    """Hata ayrıntısını döndürür; tam traceback yalnızca debug modunda oluşturulur"""
+    if st.session_state.get("debug_mode"):
+        return traceback.format_exc()
+    return repr(error)
+
 
 def get_available_llm_providers():
     """Mevcut LLM sağlayıcılarını döndürür"""
     return LLM_PROVIDERS
 
 
+# Sistem mesajının araç listesinden önceki sabit kısmı
+SYSTEM_MESSAGE_PREFIX = """Sen bir ekip ve görev tasarım uzmanısın. Kullanıcının belirttiği senaryoya uygun bir CrewAI yapılandırması oluşturacaksın.
+    
+    # ... mevcut sistem mesajı ...
+    """
+
+
+@lru_cache(maxsize=1)
+def get_base_system_message() -> str:
+    """Sabit sistem mesajını araç listesiyle birlikte döndürür"""
+    return SYSTEM_MESSAGE_PREFIX + get_tool_descriptions_text()
+
+
+@lru_cache(maxsize=1)
+def get_tool_descriptions_text() -> str:
+    """Sistem mesajı için araç listesini "- isim: açıklama" satırları olarak döndürür"""
+    return "\n".join(
+        f"- {name}: {description}"
+        for name, description in get_tool_descriptions().items()
+    )
+
+
 def generate_crew_with_llm(
     user_prompt: str,
     provider: str,
     model: Optional[str] = None,
     existing_config: Optional[Dict[str, Any]] = None,
     update_scope: str = "all",
+    on_chunk: Optional[Callable[[str], None]] = None,
 ) -> Tuple[Dict[str, Any], List[str]]:
     """
     Kullanıcı isteği doğrultusunda LLM kullanarak bir CrewAI yapılandırması oluşturur
@@ -34,56 +68,49 @@ def generate_crew_with_llm(
         model: Kullanılacak model adı (opsiyonel)
         existing_config: Mevcut yapılandırma (opsiyonel)
         update_scope: Güncelleme kapsamı - "all", "agents", "tasks"
+        on_chunk: Verilirse yanıt akış olarak alınır ve biriken metin her parçada
+            bu fonksiyona iletilir (opsiyonel)
 
     Returns:
         Oluşturulan config ve uyarılar
     """
     warnings = []
 
-    # Kullanılabilir araçlar hakkında bilgi al
-    available_tools = get_available_tools()
-    tool_descriptions = "\n".join(
-        [f"- {name}: {info['description']}" for name, info in available_tools.items()]
-    )
-
-    # Sistem mesajı
-    system_msg = (
-        """Sen bir ekip ve görev tasarım uzmanısın. Kullanıcının belirttiği senaryoya uygun bir CrewAI yapılandırması oluşturacaksın.
-    
-    # ... mevcut sistem mesajı ...
-    """
-        + tool_descriptions
-    )
+    # Sistem mesajı (sabit kısım ve araç listesi önbellekten gelir)
+    system_msg = get_base_system_message()
 
     # Mevcut yapılandırma ve güncelleme kapsamı bilgilerini ekle
     if existing_config:
-        system_msg += "\n\nMevcut yapılandırma:\n"
+        parts = [system_msg, "\n\nMevcut yapılandırma:\n"]
         if existing_config.get("agents"):
-            system_msg += "Agents:\n"
+            parts.append("Agents:\n")
             for agent in existing_config["agents"]:
-                system_msg += f"- {agent['role']}: {agent['goal']}\n"
+                parts.append(f"- {agent['role']}: {agent['goal']}\n")
 
         if existing_config.get("tasks"):
-            system_msg += "\nTasks:\n"
+            parts.append("\nTasks:\n")
             for task in existing_config["tasks"]:
-                system_msg += f"- {task['name']}: {task['description']}\n"
+                parts.append(f"- {task['name']}: {task['description']}\n")
 
         if update_scope == "agents":
-            system_msg += "\nSadece ajanları güncelle, görevlere dokunma."
+            parts.append("\nSadece ajanları güncelle, görevlere dokunma.")
         elif update_scope == "tasks":
-            system_msg += "\nSadece görevleri güncelle, ajanlara dokunma."
+            parts.append("\nSadece görevleri güncelle, ajanlara dokunma.")
         else:
-            system_msg += "\nHem ajanları hem de görevleri güncelle."
+            parts.append("\nHem ajanları hem de görevleri güncelle.")
+        system_msg = "".join(parts)
 
     try:
         # Sağlayıcıya göre API çağrısı yap
         if provider == "openai":
-            config, api_warnings = call_openai_api(system_msg, user_prompt, model)
+            config, api_warnings = call_openai_api(
+                system_msg, user_prompt, model, on_chunk
+            )
             warnings.extend(api_warnings)
         elif provider == "openrouter":
             try:
                 config, api_warnings = call_openrouter_api(
-                    system_msg, user_prompt, model
+                    system_msg, user_prompt, model, on_chunk
                 )
                 warnings.extend(api_warnings)
             except Exception as openrouter_error:
@@ -94,7 +121,7 @@ def generate_crew_with_llm(
                 if os.environ.get("OPENAI_API_KEY"):
                     fallback_model = "gpt-3.5-turbo"  # Fallback model
                     config, api_warnings = call_openai_api(
-                        system_msg, user_prompt, fallback_model
+                        system_msg, user_prompt, fallback_model, on_chunk
                     )
                     warnings.extend(api_warnings)
                     warnings.append(
@@ -121,20 +148,27 @@ def generate_crew_with_llm(
         return config, warnings
 
     except Exception as e:
-        import traceback
-
-        error_details = traceback.format_exc()
         st.error(f"LLM çağrısı sırasında hata: {str(e)}")
-        print(error_details)
+        print(format_error_details(e))
         return {"agents": [], "tasks": []}, [f"LLM çağrısı sırasında hata: {str(e)}"]
 
 
+@lru_cache(maxsize=4)
+def get_openai_client(api_key: str):
+    """API anahtarı başına tek bir OpenAI istemcisi döndürür"""
+    # İstemci HTTP bağlantı havuzunu tutar; çağrılar arasında paylaşılır
+    import openai
+
+    return openai.OpenAI(api_key=api_key)
+
+
 def call_openai_api(
-    system_msg: str, user_prompt: str, model: Optional[str] = None
+    system_msg: str,
+    user_prompt: str,
+    model: Optional[str] = None,
+    on_chunk: Optional[Callable[[str], None]] = None,
 ) -> Tuple[Dict[str, Any], List[str]]:
     """OpenAI API'yi çağırır"""
-    import openai
-
     warnings = []
 
     # API anahtarını kontrol et
@@ -150,7 +184,7 @@ def call_openai_api(
 
     try:
         # API çağrısı
-        client = openai.OpenAI(api_key=api_key)
+        client = get_openai_client(api_key)
         response = client.chat.completions.create(
             model=model,
             messages=[
@@ -158,11 +192,21 @@ def call_openai_api(
                 {"role": "user", "content": user_prompt},
             ],
             temperature=0.7,
+            stream=on_chunk is not None,
         )
 
+        # Akış modunda parçaları biriktir ve arayüze ilet
+        if on_chunk is not None:
+            result_text = ""
+            for chunk in response:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    result_text += chunk.choices[0].delta.content
+                    on_chunk(result_text)
+        else:
+            result_text = response.choices[0].message.content
+
         # Yanıtı JSON'a dönüştür
-        result_text = response.choices[0].message.content
-        config = json.loads(result_text)
+        config = extract_json_object(result_text)
 
         return validate_crew_config(config)
 
@@ -175,7 +219,10 @@ def call_openai_api(
 
 
 def call_openrouter_api(
-    system_msg: str, user_prompt: str, model: Optional[str] = None
+    system_msg: str,
+    user_prompt: str,
+    model: Optional[str] = None,
+    on_chunk: Optional[Callable[[str], None]] = None,
 ) -> Tuple[Dict[str, Any], List[str]]:
     """OpenRouter API'yi çağırır"""
     warnings = []
@@ -192,13 +239,10 @@ def call_openrouter_api(
         model = "openai/gpt-4-turbo"
 
     try:
-        # Session oluştur ve yeniden kullanılabilir hale getir
-        session = requests.Session()
-
-        # API çağrısı
-        response = session.post(
+        # API çağrısı (paylaşılan session açık bağlantıları yeniden kullanır,
+        # SSL doğrulaması session üzerinde kapatılmıştır)
+        response = OPENROUTER_SESSION.post(
             url="https://openrouter.ai/api/v1/chat/completions",
-            verify=False,  # SSL doğrulamasını devre dışı bırak
             headers={
                 "Authorization": f"Bearer {api_key}",
                 "Content-Type": "application/json",
@@ -213,8 +257,10 @@ def call_openrouter_api(
                 ],
                 "temperature": 0.7,
                 "max_tokens": 4000,
+                "stream": on_chunk is not None,
             },
             timeout=60,  # Timeout değerini artır
+            stream=on_chunk is not None,
         )
 
         if response.status_code != 200:
@@ -233,17 +279,14 @@ def call_openrouter_api(
             ]
 
         # Yanıtı JSON'a dönüştür
-        result = response.json()
-        result_text = result["choices"][0]["message"]["content"]
-
-        # JSON içeriğini temizle - bazen model fazladan karakterler ekleyebilir
-        result_text = result_text.strip()
-        if result_text.startswith("```json"):
-            result_text = result_text[7:]
-        if result_text.endswith("```"):
-            result_text = result_text[:-3]
+        if on_chunk is not None:
+            result_text = read_openrouter_stream(response, on_chunk)
+        else:
+            result = response.json()
+            result_text = result["choices"][0]["message"]["content"]
 
-        config = json.loads(result_text)
+        # Model JSON'u ``` blokları veya açıklamalarla sarabilir
+        config = extract_json_object(result_text)
         return validate_crew_config(config)
 
     except json.JSONDecodeError as e:
@@ -251,12 +294,42 @@ def call_openrouter_api(
             f"LLM yanıtı geçerli bir JSON formatında değil: {str(e)}"
         ]
     except Exception as e:
-        import traceback
+        # Ayrıntılar konsola yazılır; uyarıda yalnızca hata mesajı gösterilir
+        print(format_error_details(e))
+        return {"agents": [], "tasks": []}, [f"OpenRouter API hatası: {str(e)}"]
 
-        error_details = traceback.format_exc()
-        return {"agents": [], "tasks": []}, [
-            f"OpenRouter API hatası: {str(e)}\n{error_details}"
-        ]
+
+def extract_json_object(text: str) -> Any:
+    """
+    Metindeki ilk JSON nesnesini ayrıştırır
+
+    Ayrıştırma ilk "{" karakterinden başlar ve nesne bittiğinde durur; öncesindeki
+    ve sonrasındaki ``` işaretleri veya açıklamalar yok sayılır.
+    """
+    start = text.find("{")
+    if start == -1:
+        return json.loads(text)
+    return JSON_DECODER.raw_decode(text, start)[0]
+
+
+def read_openrouter_stream(response, on_chunk: Callable[[str], None]) -> str:
+    """OpenRouter SSE akışını okur, biriken metni her parçada on_chunk'a iletir"""
+    result_text = ""
+    for line in response.iter_lines(decode_unicode=True):
+        # Boş satırlar ve ": OPENROUTER PROCESSING" gibi SSE yorumları atlanır
+        if not line or not line.startswith("data: "):
+            continue
+
+        payload = line[len("data: ") :]
+        if payload == "[DONE]":
+            break
+
+        delta = json.loads(payload)["choices"][0].get("delta", {}).get("content")
+        if delta:
+            result_text += delta
+            on_chunk(result_text)
+
+    return result_text
 
 
 def validate_crew_config(config: Dict[str, Any]) -> Tuple[Dict[str, Any], List[str]]:
@@ -281,83 +354,92 @@ def validate_crew_config(config: Dict[str, Any]) -> Tuple[Dict[str, Any], List[s
         if "name" not in agent:
             agent["name"] = "unnamed_agent"
             warnings.append(
-                f"İsimsiz agent tespit edildi. Otomatik olarak '{agent['name']}' olarak isimlendirildi."
+                "İsimsiz agent tespit edildi. Otomatik olarak 'unnamed_agent' olarak isimlendirildi."
             )
+        name = agent["name"]
 
         # Boşlukları alt çizgi ile değiştir
-        if " " in agent["name"]:
-            old_name = agent["name"]
-            agent["name"] = agent["name"].replace(" ", "_")
+        if " " in name:
+            old_name, name = name, name.replace(" ", "_")
+            agent["name"] = name
             warnings.append(
-                f"Agent ismi '{old_name}' boşluk içeriyor. '{agent['name']}' olarak düzeltildi."
+                f"Agent ismi '{old_name}' boşluk içeriyor. '{name}' olarak düzeltildi."
             )
 
         # Araçları doğrula
-        if "tools" not in agent or not agent["tools"]:
+        tools = agent.get("tools")
+        if not tools:
             agent["tools"] = []
-            warnings.append(f"Agent '{agent['name']}' için araç tanımlanmamış.")
+            warnings.append(f"Agent '{name}' için araç tanımlanmamış.")
         else:
             valid_tools = []
-            for tool in agent["tools"]:
+            for tool in tools:
                 if tool in available_tools:
                     valid_tools.append(tool)
                 else:
                     warnings.append(
-                        f"Bilinmeyen araç '{tool}' agent '{agent['name']}' için tanımlanmış. Bu araç atlanacak."
+                        f"Bilinmeyen araç '{tool}' agent '{name}' için tanımlanmış. Bu araç atlanacak."
                     )
             agent["tools"] = valid_tools
 
+    # Agent isimleri yukarıda kesinleşti; görevler bu küme üzerinden doğrulanır
+    agent_names = [a["name"] for a in config.get("agents", [])]
+    agent_name_set = set(agent_names)
+
     # Her task için kontroller
     for task in config.get("tasks", []):
         # Gerekli alanları kontrol et
         if "name" not in task:
             task["name"] = "unnamed_task"
             warnings.append(
-                f"İsimsiz task tespit edildi. Otomatik olarak '{task['name']}' olarak isimlendirildi."
+                "İsimsiz task tespit edildi. Otomatik olarak 'unnamed_task' olarak isimlendirildi."
             )
+        name = task["name"]
 
         # Boşlukları alt çizgi ile değiştir
-        if " " in task["name"]:
-            old_name = task["name"]
-            task["name"] = task["name"].replace(" ", "_")
+        if " " in name:
+            old_name, name = name, name.replace(" ", "_")
+            task["name"] = name
             warnings.append(
-                f"Task ismi '{old_name}' boşluk içeriyor. '{task['name']}' olarak düzeltildi."
+                f"Task ismi '{old_name}' boşluk içeriyor. '{name}' olarak düzeltildi."
             )
 
         # Agent'ı doğrula
         if "agent" not in task:
-            if config.get("agents"):
-                task["agent"] = config["agents"][0]["name"]
+            if agent_names:
+                task["agent"] = agent_names[0]
                 warnings.append(
-                    f"Task '{task['name']}' için agent belirtilmemiş. İlk agent '{task['agent']}' atandı."
+                    f"Task '{name}' için agent belirtilmemiş. İlk agent '{agent_names[0]}' atandı."
                 )
             else:
                 warnings.append(
-                    f"Task '{task['name']}' için agent belirtilmemiş ve yapılandırmada hiç agent yok."
+                    f"Task '{name}' için agent belirtilmemiş ve yapılandırmada hiç agent yok."
                 )
         else:
             # Agent'ın varlığını kontrol et
-            agent_names = [a["name"] for a in config.get("agents", [])]
-            if task["agent"] not in agent_names:
+            if task["agent"] not in agent_name_set:
                 if agent_names:
                     task["agent"] = agent_names[0]
                     warnings.append(
-                        f"Task '{task['name']}' için tanımlanan agent bulunamadı. '{task['agent']}' olarak değiştirildi."
+                        f"Task '{name}' için tanımlanan agent bulunamadı. '{agent_names[0]}' olarak değiştirildi."
                     )
                 else:
                     warnings.append(
-                        f"Task '{task['name']}' için tanımlanan agent bulunamadı ve yapılandırmada hiç agent yok."
+                        f"Task '{name}' için tanımlanan agent bulunamadı ve yapılandırmada hiç agent yok."
                     )
 
     return config, warnings
 
 
-def get_example_scenario_prompts() -> List[str]:
+EXAMPLE_SCENARIO_PROMPTS = (
+    "Bir incident analiz sistemi oluşturmak istiyorum. Bu sistem, güvenlik olaylarını analiz edip raporlayabilmeli.",
+    "Bir içerik pazarlama ekibi için bir CrewAI sistemi oluşturmak istiyorum. Blog yazıları için araştırma yapıp yazabilmeli.",
+    "Müşteri geri bildirimlerini analiz eden ve ürün geliştirme önerileri sunan bir sistem istiyorum.",
+    "Rakip analizi yapan ve pazar fırsatlarını belirleyen bir sistem oluşturmak istiyorum.",
+    "Web sitemi SEO açısından analiz edip iyileştirmeler öneren bir sistem istiyorum.",
+)
+
+
+def get_example_scenario_prompts() -> Tuple[str, ...]:
     """Örnek senaryo promptlarını döndürür"""
-    return [
-        "Bir incident analiz sistemi oluşturmak istiyorum. Bu sistem, güvenlik olaylarını analiz edip raporlayabilmeli.",
-        "Bir içerik pazarlama ekibi için bir CrewAI sistemi oluşturmak istiyorum. Blog yazıları için araştırma yapıp yazabilmeli.",
-        "Müşteri geri bildirimlerini analiz eden ve ürün geliştirme önerileri sunan bir sistem istiyorum.",
-        "Rakip analizi yapan ve pazar fırsatlarını belirleyen bir sistem oluşturmak istiyorum.",
-        "Web sitemi SEO açısından analiz edip iyileştirmeler öneren bir sistem istiyorum.",
-    ]
+    return EXAMPLE_SCENARIO_PROMPTS
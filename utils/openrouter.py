@@ -1,14 +1,63 @@
-import os
+import json
+import time
 import requests
+import urllib3
 import streamlit as st
-from typing import List, Dict, Any
+from pathlib import Path
+from typing import List, Dict, Optional, Tuple
 
+# Raw OpenRouter model data is kept on disk so cold starts skip the HTTP call
+MODELS_CACHE_PATH = (
+    Path.home() / ".cache" / "crewai-generator" / "openrouter_models.json"
+)
+MODELS_CACHE_TTL = 3600
 
-import requests
-from typing import List, Dict, Optional
+# Shared HTTP session so repeated OpenRouter requests reuse kept-alive connections
+OPENROUTER_SESSION = requests.Session()
+OPENROUTER_SESSION.verify = False
+
+# SSL verification is disabled on the session; silence the per-request warning
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+# When the model list currently held in memory was fetched from OpenRouter
+models_fetched_at: Optional[float] = None
+
+
+def load_models_cache() -> Optional[Tuple[float, List[Dict]]]:
+    """
+    Reads the raw model list from the disk cache if it is still fresh.
+
+    Returns:
+        Optional[Tuple[float, List[Dict]]]: Time the cache was written and the
+        cached model data, or None if stale, empty or unreadable.
+    """
+    try:
+        written_at = MODELS_CACHE_PATH.stat().st_mtime
+        if time.time() - written_at >= MODELS_CACHE_TTL:
+            return None
+        with MODELS_CACHE_PATH.open("r", encoding="utf-8") as f:
+            data = json.load(f)
+        return (written_at, data) if data else None
+    except (OSError, ValueError):
+        return None
+
+
+def save_models_cache(data: List[Dict]) -> None:
+    """
+    Writes the raw model list to the disk cache, ignoring filesystem errors.
+
+    Args:
+        data (List[Dict]): Model data as returned by the OpenRouter API.
+    """
+    try:
+        MODELS_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with MODELS_CACHE_PATH.open("w", encoding="utf-8") as f:
+            json.dump(data, f)
+    except OSError as e:
+        print(f"Error writing model cache: {e}")
 
 
-@st.cache_data(ttl=3600)
+@st.cache_data(ttl=MODELS_CACHE_TTL, show_spinner=False)
 def get_openrouter_models(free_only: bool = False) -> List[Dict]:
     """
     Fetches model data from OpenRouter API and returns a filtered list of models.
@@ -19,47 +68,134 @@ def get_openrouter_models(free_only: bool = False) -> List[Dict]:
     Returns:
         List[Dict]: List of models with name, slug, author, and provider information.
     """
+    global models_fetched_at
     api_url = "https://openrouter.ai/api/frontend/models"
 
     try:
-        response = requests.get(api_url, verify=False)
-        response.raise_for_status()  # Raise an exception for bad status codes
+        cached = load_models_cache()
+        if cached:
+            fetched_at, data = cached
+        else:
+            fetched_at = time.time()
+            response = OPENROUTER_SESSION.get(api_url, timeout=10)
+            response.raise_for_status()  # Raise an exception for bad status codes
+
+            data = response.json().get("data", [])
+            # An empty list would pin every cold start to no models until the TTL
+            if data:
+                save_models_cache(data)
+
+        if data:
+            models_fetched_at = fetched_at
 
-        data = response.json().get("data", [])
         models_list = []
 
         for model in data:
-            # Check if model has required fields
-            if all(key in model for key in ["name", "slug", "author"]):
-                # Check if we need to filter for free models
-                if free_only:
-                    # Check for ":free" suffix in the slug
-                    if not (
-                        isinstance(model["slug"], str) and ":free" in model["slug"]
-                    ):
-                        continue
-
-                # Extract provider name from endpoint if available
-                provider_name = None
-                if (
-                    "endpoint" in model
-                    and model["endpoint"]
-                    and "provider_name" in model["endpoint"]
-                ):
-                    provider_name = model["endpoint"]["provider_name"]
-                is_free = isinstance(model["slug"], str) and ":free" in model["slug"]
-                # Extract relevant information
-                model_info = {
-                    "name": model["name"],
-                    "model_id": model["slug"],  # Using slug as the model identifier
-                    "author": model["author"].upper(),
-                    "provider": provider_name,  # Add provider name from endpoint
-                    "is_free": is_free,
-                }
-                models_list.append(model_info)
+            # Skip models missing required fields
+            try:
+                name, slug, author = model["name"], model["slug"], model["author"]
+            except KeyError:
+                continue
+
+            # Check for ":free" suffix in the slug
+            is_free = isinstance(slug, str) and ":free" in slug
+
+            # Check if we need to filter for free models
+            if free_only and not is_free:
+                continue
+
+            # Extract provider name from endpoint if available
+            provider_name = None
+            if (
+                "endpoint" in model
+                and model["endpoint"]
+                and "provider_name" in model["endpoint"]
+            ):
+                provider_name = model["endpoint"]["provider_name"]
+
+            # Extract relevant information
+            model_info = {
+                "name": name,
+                "model_id": slug,  # Using slug as the model identifier
+                "author": author.upper(),
+                "provider": provider_name,  # Add provider name from endpoint
+                "is_free": is_free,
+            }
+            models_list.append(model_info)
 
         return models_list
 
     except requests.exceptions.RequestException as e:
         print(f"Error fetching models: {e}")
         return []
+
+
+@st.cache_data(ttl=MODELS_CACHE_TTL, show_spinner=False)
+def get_openrouter_model_ids(free_only: bool = False) -> List[str]:
+    """
+    Returns the OpenRouter model identifiers used as selectbox options.
+
+    Args:
+        free_only (bool): If True, returns only free models.
+
+    Returns:
+        List[str]: Model identifiers (slugs) in API order.
+    """
+    return [model["model_id"] for model in get_openrouter_models(free_only)]
+
+
+@st.cache_data(ttl=MODELS_CACHE_TTL, show_spinner=False)
+def get_openrouter_model_index(free_only: bool = False) -> Dict[str, int]:
+    """
+    Maps each OpenRouter model identifier to its position in the options list.
+
+    Args:
+        free_only (bool): If True, indexes only free models.
+
+    Returns:
+        Dict[str, int]: Model identifier to selectbox index.
+    """
+    return {
+        model_id: idx
+        for idx, model_id in enumerate(get_openrouter_model_ids(free_only))
+    }
+
+
+@st.cache_data(ttl=MODELS_CACHE_TTL, show_spinner=False)
+def get_openrouter_model_search_keys(free_only: bool = False) -> List[str]:
+    """
+    Returns the lowercased OpenRouter model identifiers for search filtering.
+
+    Args:
+        free_only (bool): If True, returns keys for free models only.
+
+    Returns:
+        List[str]: Lowercased identifiers, parallel to get_openrouter_model_ids().
+    """
+    return [model_id.lower() for model_id in get_openrouter_model_ids(free_only)]
+
+
+def get_models_cache_time() -> Optional[float]:
+    """
+    Returns when the model list held in memory was fetched from OpenRouter.
+
+    Returns:
+        Optional[float]: Fetch timestamp, or None if no models have been loaded.
+    """
+    return models_fetched_at
+
+
+def clear_models_cache() -> None:
+    """
+    Drops the disk cache and the Streamlit caches built on top of it.
+    """
+    global models_fetched_at
+    models_fetched_at = None
+    get_openrouter_models.clear()
+    get_openrouter_model_ids.clear()
+    get_openrouter_model_index.clear()
+    get_openrouter_model_search_keys.clear()
+    try:
+        MODELS_CACHE_PATH.unlink()
+    except OSError:
+        pass
@@ -1,75 +1,120 @@
-from typing import Dict, Any
+import hashlib
+import json
+import textwrap
+from types import MappingProxyType
+from typing import Dict, Any, Mapping
 
 
-def get_system_prompt_for_framework(framework: str) -> str:
-    """Returns the system prompt for the specified framework."""
-    if framework == "crewai":
-        return """
+def normalize_prompt(prompt: str) -> str:
+    """Strips source indentation so the prompt text stays byte-stable."""
+    return textwrap.dedent(prompt).strip() + "\n"
+
+
+def format_response_schema(schema: Dict[str, Any]) -> str:
+    """Serializes a response schema example for embedding in a system prompt."""
+    return json.dumps(schema, indent=4) + "\n"
+
+
+# System prompts per framework, built once at import. Each is a static
+# instruction prefix followed by the serialized response schema, so anything
+# that varies per request can be appended without changing the cached prefix
+CREWAI_PROMPT_PREFIX = normalize_prompt("""
         You are an expert at creating AI research assistants using CrewAI. Based on the user's request,
         suggest appropriate agents, their roles, tools, and tasks. Format your response as JSON with this structure:
+        """)
+CREWAI_RESPONSE_SCHEMA = {
+    "agents": [
+        {
+            "name": "agent name",
+            "role": "specific role description",
+            "goal": "clear goal",
+            "backstory": "relevant backstory",
+            "tools": ["tool1", "tool2"],
+            "verbose": True,
+            "allow_delegation": False,
+        }
+    ],
+    "tasks": [
         {
-            "agents": [
-                {
-                    "name": "agent name",
-                    "role": "specific role description",
-                    "goal": "clear goal",
-                    "backstory": "relevant backstory",
-                    "tools": ["tool1", "tool2"],
-                    "verbose": true,
-                    "allow_delegation": true/false
-                }
-            ],
-            "tasks": [
-                {
-                    "name": "task name",
-                    "description": "detailed description",
-                    "tools": ["required tools"],
-                    "agent": "agent name",
-                    "expected_output": "specific expected output"
-                }
-            ]
+            "name": "task name",
+            "description": "detailed description",
+            "tools": ["required tools"],
+            "agent": "agent name",
+            "expected_output": "specific expected output",
         }
-        """
-    elif framework == "langgraph":
-        return """
+    ],
+}
+CREWAI_SYSTEM_PROMPT = CREWAI_PROMPT_PREFIX + format_response_schema(
+    CREWAI_RESPONSE_SCHEMA
+)
+
+LANGGRAPH_PROMPT_PREFIX = normalize_prompt("""
         You are an expert at creating AI agents using LangChain's LangGraph framework. Based on the user's request,
         suggest appropriate agents, their roles, tools, and nodes for the graph. Format your response as JSON with this structure:
+        """)
+LANGGRAPH_RESPONSE_SCHEMA = {
+    "agents": [
+        {
+            "name": "agent name",
+            "role": "specific role description",
+            "goal": "clear goal",
+            "tools": ["tool1", "tool2"],
+            "llm": "model name (e.g., gpt-4)",
+        }
+    ],
+    "nodes": [
+        {
+            "name": "node name",
+            "description": "detailed description",
+            "agent": "agent name",
+        }
+    ],
+    "edges": [
         {
-            "agents": [
-                {
-                    "name": "agent name",
-                    "role": "specific role description",
-                    "goal": "clear goal",
-                    "tools": ["tool1", "tool2"],
-                    "llm": "model name (e.g., gpt-4)"
-                }
-            ],
-            "nodes": [
-                {
-                    "name": "node name",
-                    "description": "detailed description",
-                    "agent": "agent name"
-                }
-            ],
-            "edges": [
-                {
-                    "source": "source node name",
-                    "target": "target node name",
-                    "condition": "condition description (optional)"
-                }
-            ]
+            "source": "source node name",
+            "target": "target node name",
+            "condition": "condition description (optional)",
         }
-        """
-    else:
-        return """
+    ],
+}
+LANGGRAPH_SYSTEM_PROMPT = LANGGRAPH_PROMPT_PREFIX + format_response_schema(
+    LANGGRAPH_RESPONSE_SCHEMA
+)
+
+DEFAULT_SYSTEM_PROMPT = normalize_prompt("""
         You are an expert at creating AI research assistants. Based on the user's request,
         suggest appropriate agents, their roles, tools, and tasks.
-        """
+        """)
 
+SYSTEM_PROMPTS = {
+    "crewai": CREWAI_SYSTEM_PROMPT,
+    "langgraph": LANGGRAPH_SYSTEM_PROMPT,
+}
 
-def get_framework_description(framework: str) -> str:
-    """Returns the description for the specified framework."""
-    framework_descriptions = {
+
+# Content fingerprints of the system prompts, for keying downstream response caches
+SYSTEM_PROMPT_FINGERPRINTS = {
+    framework: hashlib.blake2b(prompt.encode(), digest_size=16).digest()
+    for framework, prompt in SYSTEM_PROMPTS.items()
+}
+DEFAULT_SYSTEM_PROMPT_FINGERPRINT = hashlib.blake2b(
+    DEFAULT_SYSTEM_PROMPT.encode(), digest_size=16
+).digest()
+
+
+def get_system_prompt_for_framework(framework: str, dynamic: str = "") -> str:
+    """Returns the system prompt for the framework with dynamic text appended."""
+    return SYSTEM_PROMPTS.get(framework, DEFAULT_SYSTEM_PROMPT) + dynamic
+
+
+def get_system_prompt_fingerprint(framework: str) -> bytes:
+    """Returns the BLAKE2b digest of the static system prompt for the framework."""
+    return SYSTEM_PROMPT_FINGERPRINTS.get(framework, DEFAULT_SYSTEM_PROMPT_FINGERPRINT)
+
+
+# Short descriptions shown for each framework
+FRAMEWORK_DESCRIPTIONS = MappingProxyType(
+    {
         "crewai": """
         **CrewAI** is a framework for orchestrating role-playing autonomous AI agents. 
         It allows you to create a crew of agents that work together to accomplish tasks, 
@@ -81,12 +126,11 @@ def get_framework_description(framework: str) -> str:
         and edges represent the flow of information between them.
         """,
     }
-    return framework_descriptions.get(framework, "")
-
+)
 
-def get_example_prompts() -> Dict[str, str]:
-    """Returns example prompts for different use cases."""
-    return {
+# Example prompts for different use cases
+EXAMPLE_PROMPTS = MappingProxyType(
+    {
         "Research Assistant": "I need a research assistant that summarizes papers and answers questions",
         "Content Creation": "I need a team to create viral social media content and manage our brand presence",
         "Data Analysis": "I need a team to analyze customer data and create visualizations",
@@ -100,58 +144,83 @@ def get_example_prompts() -> Dict[str, str]:
         "Educational Content": "I need a team to develop interactive learning materials for programming courses",
         "Security Audit": "I need agents to perform security assessments, identify vulnerabilities, and suggest mitigations",
     }
+)
+
+
+def get_framework_description(framework: str) -> str:
+    """Returns the description for the specified framework."""
+    return FRAMEWORK_DESCRIPTIONS.get(framework, "")
+
+
+def get_example_prompts() -> Mapping[str, str]:
+    """Returns example prompts for different use cases."""
+    return EXAMPLE_PROMPTS
 
 
 def get_default_config(framework: str) -> Dict[str, Any]:
     """Returns default configuration for the specified framework when model generation fails."""
-    if framework == "crewai":
-        return {
-            "agents": [
-                {
-                    "name": "default_assistant",
-                    "role": "General Assistant",
-                    "goal": "Help with basic tasks",
-                    "backstory": "Versatile assistant with general knowledge",
-                    "tools": ["basic_tool"],
-                    "verbose": True,
-                    "allow_delegation": False,
-                }
-            ],
-            "tasks": [
-                {
-                    "name": "basic_task",
-                    "description": "Handle basic requests",
-                    "tools": ["basic_tool"],
-                    "agent": "default_assistant",
-                    "expected_output": "Task completion",
-                }
-            ],
-        }
-    elif framework == "langgraph":
-        return {
-            "agents": [
-                {
-                    "name": "default_assistant",
-                    "role": "General Assistant",
-                    "goal": "Help with basic tasks",
-                    "tools": ["basic_tool"],
-                    "llm": "gpt-4",
-                }
-            ],
-            "nodes": [
-                {
-                    "name": "process_input",
-                    "description": "Process user input",
-                    "agent": "default_assistant",
-                }
-            ],
-            "edges": [
-                {
-                    "source": "process_input",
-                    "target": "END",
-                    "condition": "task completed",
-                }
-            ],
-        }
-    else:
-        return {}
+    # Builders return fresh dicts, so callers may modify the config freely
+    builder = DEFAULT_CONFIG_BUILDERS.get(framework)
+    return builder() if builder else {}
+
+
+def build_crewai_default_config() -> Dict[str, Any]:
+    """Builds the default CrewAI configuration."""
+    return {
+        "agents": [
+            {
+                "name": "default_assistant",
+                "role": "General Assistant",
+                "goal": "Help with basic tasks",
+                "backstory": "Versatile assistant with general knowledge",
+                "tools": ["basic_tool"],
+                "verbose": True,
+                "allow_delegation": False,
+            }
+        ],
+        "tasks": [
+            {
+                "name": "basic_task",
+                "description": "Handle basic requests",
+                "tools": ["basic_tool"],
+                "agent": "default_assistant",
+                "expected_output": "Task completion",
+            }
+        ],
+    }
+
+
+def build_langgraph_default_config() -> Dict[str, Any]:
+    """Builds the default LangGraph configuration."""
+    return {
+        "agents": [
+            {
+                "name": "default_assistant",
+                "role": "General Assistant",
+                "goal": "Help with basic tasks",
+                "tools": ["basic_tool"],
+                "llm": "gpt-4",
+            }
+        ],
+        "nodes": [
+            {
+                "name": "process_input",
+                "description": "Process user input",
+                "agent": "default_assistant",
+            }
+        ],
+        "edges": [
+            {
+                "source": "process_input",
+                "target": "END",
+                "condition": "task completed",
+            }
+        ],
+    }
+
+
+# Default configuration builder for each framework
+DEFAULT_CONFIG_BUILDERS = {
+    "crewai": build_crewai_default_config,
+    "langgraph": build_langgraph_default_config,
+}